@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 13:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('agents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='agentanalysisnotificationdelivery',
+            index=models.Index(condition=models.Q(('success', False)), fields=['next_retry_at', 'attempt_count', 'max_attempts'], name='analysis_delivery_unsent_idx'),
+        ),
+    ]
@@ -238,6 +238,11 @@ class AgentAnalysisNotificationDelivery(TimeStampedModel):
             models.Index(fields=("endpoint", "created_at")),
             models.Index(fields=("event_type", "created_at")),
             models.Index(fields=("success", "next_retry_at")),
+            models.Index(
+                fields=("next_retry_at", "attempt_count", "max_attempts"),
+                condition=models.Q(success=False),
+                name="analysis_delivery_unsent_idx",
+            ),
         ]
 
     def __str__(self) -> str:
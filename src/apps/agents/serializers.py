@@ -155,26 +155,21 @@ class AgentAnalysisRunStatusSerializer(serializers.Serializer):
     error_message = serializers.CharField(allow_blank=True)
 
 
-class AgentAnalysisWebhookEndpointSerializer(serializers.ModelSerializer):
+class AgentAnalysisWebhookEndpointSerializer(serializers.Serializer):
+    # Declared explicitly rather than via ModelSerializer: writes go through
+    # AnalysisWebhookEndpointService anyway, and this skips rebuilding the field
+    # map from model introspection on every request.
+    id = serializers.IntegerField(read_only=True)
+    owner = serializers.IntegerField(source="owner_id", read_only=True)
+    name = serializers.CharField(max_length=128)
+    callback_url = serializers.URLField(max_length=500)
     signing_secret = serializers.CharField(write_only=True, required=False, allow_blank=True)
     has_signing_secret = serializers.SerializerMethodField()
-
-    class Meta:
-        model = AgentAnalysisWebhookEndpoint
-        fields = [
-            "id",
-            "owner",
-            "name",
-            "callback_url",
-            "signing_secret",
-            "has_signing_secret",
-            "is_active",
-            "event_types",
-            "headers",
-            "created_at",
-            "updated_at",
-        ]
-        read_only_fields = ("owner", "has_signing_secret", "created_at", "updated_at")
+    is_active = serializers.BooleanField(required=False)
+    event_types = serializers.JSONField(required=False)
+    headers = serializers.JSONField(required=False)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
 
     def get_has_signing_secret(self, obj: AgentAnalysisWebhookEndpoint) -> bool:
         return bool(obj.signing_secret_encrypted)
@@ -25,9 +25,7 @@ class AnalysisWebhookEndpointService:
 
     @property
     def crypto(self) -> SecretCrypto:
-        if self._crypto is None:
-            self._crypto = SecretCrypto()
-        return self._crypto
+        return self._crypto or SecretCrypto.shared()
 
     def create_for_user(
         self,
@@ -189,11 +187,14 @@ class AnalysisRunNotificationDispatchService:
         self,
         run: AgentAnalysisRun,
     ) -> QuerySet[AgentAnalysisWebhookEndpoint]:
-        return AgentAnalysisWebhookEndpoint.objects.filter(
-            owner=run.agent.owner,
-            is_active=True,
-        ).order_by(
-            "id",
+        # Deliveries only read these columns; skip the rest of the endpoint row.
+        return (
+            AgentAnalysisWebhookEndpoint.objects.filter(
+                owner_id=run.agent.owner_id,
+                is_active=True,
+            )
+            .only("id", "callback_url", "signing_secret_encrypted", "event_types", "headers")
+            .order_by("id")
         )
 
     def _deliver(
@@ -60,6 +60,23 @@ def _paginate_queryset(
     return rows, total, page, page_size
 
 
+def _with_delivery_relations(
+    queryset: QuerySet[AgentAnalysisNotificationDelivery],
+) -> QuerySet[AgentAnalysisNotificationDelivery]:
+    # The delivery serializer reads only the endpoint name/URL and the run status;
+    # skip the large text and JSON columns of both joined rows.
+    return queryset.select_related("endpoint", "run").defer(
+        "endpoint__signing_secret_encrypted",
+        "endpoint__event_types",
+        "endpoint__headers",
+        "run__query",
+        "run__usage",
+        "run__result_text",
+        "run__error_message",
+        "run__metadata",
+    )
+
+
 class AgentAnalysisWebhookEndpointViewSet(ModelViewSet):
     serializer_class = AgentAnalysisWebhookEndpointSerializer
     permission_classes = [IsAuthenticated]
@@ -76,11 +93,9 @@ class AgentAnalysisWebhookEndpointViewSet(ModelViewSet):
         pk: str | None = None,
     ) -> Response:
         endpoint = self.get_object()
-        deliveries = (
+        deliveries = _with_delivery_relations(
             AgentAnalysisNotificationDelivery.objects.filter(endpoint=endpoint)
-            .select_related("endpoint", "run")
-            .order_by("-created_at")
-        )
+        ).order_by("-created_at")
 
         run_id_param = request.query_params.get("run_id", "")
         success_param = request.query_params.get("success", "").strip().lower()
@@ -115,14 +130,9 @@ class AgentAnalysisWebhookEndpointViewSet(ModelViewSet):
         endpoint = self.get_object()
         if not delivery_id.isdigit():
             return Response({"detail": "Delivery not found."}, status=status.HTTP_404_NOT_FOUND)
-        delivery = (
-            AgentAnalysisNotificationDelivery.objects.filter(
-                endpoint=endpoint,
-                id=int(delivery_id),
-            )
-            .select_related("endpoint", "run")
-            .first()
-        )
+        delivery = _with_delivery_relations(
+            AgentAnalysisNotificationDelivery.objects.filter(endpoint=endpoint, id=int(delivery_id))
+        ).first()
         if delivery is None:
             return Response({"detail": "Delivery not found."}, status=status.HTTP_404_NOT_FOUND)
         serializer = AgentAnalysisNotificationDeliverySerializer(delivery)
@@ -502,11 +512,9 @@ class AgentViewSet(ModelViewSet):
         if run is None:
             return Response({"detail": "Analysis run not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        deliveries = (
+        deliveries = _with_delivery_relations(
             AgentAnalysisNotificationDelivery.objects.filter(run=run)
-            .select_related("endpoint", "run")
-            .order_by("-created_at")
-        )
+        ).order_by("-created_at")
         endpoint_id_param = request.query_params.get("endpoint_id", "")
         success_param = request.query_params.get("success", "").strip().lower()
         event_type_param = request.query_params.get("event_type", "").strip()
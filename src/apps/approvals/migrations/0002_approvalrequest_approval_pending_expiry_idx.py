@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 13:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('approvals', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='approvalrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['expires_at', 'is_escalated'], name='approval_pending_expiry_idx'),
+        ),
+    ]
@@ -90,6 +90,11 @@ class ApprovalRequest(TimeStampedModel):
             models.Index(fields=("requested_by", "created_at")),
             models.Index(fields=("decided_by", "decided_at")),
             models.Index(fields=("channel", "status", "created_at")),
+            models.Index(
+                fields=("expires_at", "is_escalated"),
+                condition=models.Q(status=ApprovalStatus.PENDING),
+                name="approval_pending_expiry_idx",
+            ),
         ]
 
     def __str__(self) -> str:
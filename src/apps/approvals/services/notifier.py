@@ -17,17 +17,18 @@ class ApprovalNotifier:
                 "reason": "Telegram channel not configured for this agent.",
             }
 
-        profile = (
-            UserProfile.objects.select_related("user")
-            .filter(user=approval_request.agent.owner)
+        # Only the chat id is needed, so skip building the profile and its user.
+        telegram_chat_id = (
+            UserProfile.objects.filter(user_id=approval_request.agent.owner_id)
             .order_by("-updated_at")
+            .values_list("telegram_chat_id", flat=True)
             .first()
         )
-        if profile is None or profile.telegram_chat_id == "":
+        if not telegram_chat_id:
             return {"status": "skipped", "reason": "Owner has no telegram_chat_id configured."}
 
         response = self.telegram_client.send_approval_request(
-            chat_id=profile.telegram_chat_id,
+            chat_id=telegram_chat_id,
             approval_request=approval_request,
         )
         if response.get("ok"):
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 13:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auditevent',
+            index=models.Index(condition=models.Q(('level__in', ('warning', 'error'))), fields=['-created_at'], name='audit_alert_recent_idx'),
+        ),
+    ]
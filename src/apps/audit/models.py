@@ -35,6 +35,11 @@ class AuditEvent(TimeStampedModel):
             models.Index(fields=("entity_type", "entity_id", "created_at")),
             models.Index(fields=("request_id", "created_at")),
             models.Index(fields=("actor", "created_at")),
+            models.Index(
+                fields=("-created_at",),
+                condition=models.Q(level__in=(AuditLevel.WARNING, AuditLevel.ERROR)),
+                name="audit_alert_recent_idx",
+            ),
         ]
 
     def __str__(self) -> str:
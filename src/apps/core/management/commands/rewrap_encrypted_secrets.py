@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from apps.agents.models import AgentAnalysisWebhookEndpoint
+from apps.core.services.crypto import SecretCrypto, SecretCryptoError
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-encrypt stored secrets that still use the legacy Fernet token format "
+        "with the current AES-GCM scheme."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows updated per statement.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        batch_size = options.get("batch_size")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise CommandError("--batch-size must be a positive integer.")
+        crypto = SecretCrypto()
+
+        rewrapped: list[AgentAnalysisWebhookEndpoint] = []
+        skipped = 0
+        endpoints = (
+            AgentAnalysisWebhookEndpoint.objects.exclude(signing_secret_encrypted="")
+            .only("id", "signing_secret_encrypted")
+            .iterator(chunk_size=batch_size)
+        )
+        for endpoint in endpoints:
+            if not crypto.is_legacy_token(endpoint.signing_secret_encrypted):
+                continue
+            try:
+                plain_text = crypto.decrypt(endpoint.signing_secret_encrypted)
+            except SecretCryptoError:
+                skipped += 1
+                continue
+            endpoint.signing_secret_encrypted = crypto.encrypt(plain_text)
+            rewrapped.append(endpoint)
+
+        with transaction.atomic():
+            AgentAnalysisWebhookEndpoint.objects.bulk_update(
+                rewrapped, ["signing_secret_encrypted"], batch_size=batch_size
+            )
+
+        self.stdout.write(
+            f"Rewrapped {len(rewrapped)} webhook signing secrets; "
+            f"skipped {skipped} that could not be decrypted."
+        )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import re
-from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -9,8 +8,11 @@ from typing import Any
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand, CommandError, CommandParser
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import IntegerField, Max, Model
+from django.db.models.functions import Cast, Substr
 from django.utils import timezone
 
 from apps.accounts.models import UserProfile
@@ -41,7 +43,8 @@ from apps.execution.models import IntentStatus, OrderType, ProductType, Side, Tr
 from apps.market_data.models import Instrument, TickSnapshot
 from apps.risk.models import RiskPolicy
 
-SEED_OWNER_RE = re.compile(r"^seed_owner_(\d+)$")
+SEED_OWNER_PREFIX = "seed_owner_"
+SEED_OWNER_PATTERN = r"^seed_owner_[0-9]+$"
 DEFAULT_PASSWORD = "SeedPass!234"
 MODEL_COUNTS_ORDER = (
     "users",
@@ -61,6 +64,106 @@ MODEL_COUNTS_ORDER = (
     "tick_snapshots",
     "audit_events",
 )
+MODEL_COUNT_INDEX = {model_key: index for index, model_key in enumerate(MODEL_COUNTS_ORDER)}
+
+CORE_POLICY_LIMITS = {
+    "max_order_notional": Decimal("150000"),
+    "max_position_notional": Decimal("350000"),
+    "max_daily_loss": Decimal("12500"),
+}
+AGGRESSIVE_POLICY_LIMITS = {
+    "max_order_notional": Decimal("250000"),
+    "max_position_notional": Decimal("750000"),
+    "max_daily_loss": Decimal("40000"),
+}
+PENDING_INTENT_PRICE = Decimal("1000.00")
+PLACED_INTENT_PRICE = Decimal("1200.00")
+FAILED_INTENT_PRICE = Decimal("950.00")
+CANCELED_INTENT_PRICE = Decimal("1015.00")
+INSTRUMENT_TICK_SIZE = Decimal("0.05")
+TICK_PRICE_STEP_PER_INSTRUMENT = Decimal("0.35")
+TICK_PRICE_STEP_PER_TICK = Decimal("0.25")
+TICK_PRICE_QUANTUM = Decimal("0.01")
+INSTRUMENT_INSERT_FIELDS = (
+    "instrument_token",
+    "tradingsymbol",
+    "exchange",
+    "name",
+    "segment",
+    "instrument_type",
+    "lot_size",
+    "tick_size",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+# Every seeded run opens with the same event; one shared payload avoids rebuilding it.
+ANALYSIS_STARTED_EVENT: tuple[str, dict[str, Any]] = ("analysis.started", {"state": "running"})
+TICK_INSERT_FIELDS = (
+    "instrument",
+    "last_price",
+    "volume",
+    "oi",
+    "source",
+    "created_at",
+    "updated_at",
+)
+
+
+SEED_NAME_TEMPLATES: dict[str, str] = {
+    "owner_username": SEED_OWNER_PREFIX + "{run_code}",
+    "owner_email": "seed.owner.{run_code}@example.com",
+    "owner_last_name": "Owner {n}",
+    "approver_username": "seed_approver_{run_code}",
+    "approver_email": "seed.approver.{run_code}@example.com",
+    "approver_last_name": "Approver {n}",
+    "default_policy_name": "Core Intraday Policy {run_code}",
+    "aggressive_policy_name": "Aggressive Policy {run_code}",
+    "primary_agent_name": "Momentum Pulse {run_code}",
+    "primary_agent_slug": "momentum-pulse-{run_code}",
+    "hedge_agent_name": "Hedge Sentinel {run_code}",
+    "hedge_agent_slug": "hedge-sentinel-{run_code}",
+    "webhook_name": "seed-webhook-{run_code}",
+    "webhook_callback_url": "https://seed-{run_code}.example.com/analysis/webhook",
+    "webhook_signing_secret": "seed-signing-secret-{run_code}",
+    "approve_callback_id": "seed-callback-{run_code}-approve",
+    "reject_callback_id": "seed-callback-{run_code}-reject",
+    "broker_order_id": "KITE-{run_code}-01",
+    "owner_kite_user_id": "KITESEED{run_code}",
+    "owner_public_token": "public-token-{run_code}",
+    "approver_kite_user_id": "KITEAPPROVER{run_code}",
+    "approver_public_token": "public-token-approver-{run_code}",
+    "audit_request_id_1": "seed-{run_code}-01",
+    "audit_request_id_2": "seed-{run_code}-02",
+    "audit_request_id_3": "seed-{run_code}-03",
+    "audit_request_id_4": "seed-{run_code}-04",
+    "audit_request_id_5": "seed-{run_code}-05",
+}
+
+_DELTAS: dict[str, timedelta] = {
+    "m2": timedelta(minutes=2),
+    "m3": timedelta(minutes=3),
+    "m4": timedelta(minutes=4),
+    "m7": timedelta(minutes=7),
+    "m9": timedelta(minutes=9),
+    "m10": timedelta(minutes=10),
+    "m11": timedelta(minutes=11),
+    "m12": timedelta(minutes=12),
+    "m14": timedelta(minutes=14),
+    "m15": timedelta(minutes=15),
+    "m16": timedelta(minutes=16),
+    "m18": timedelta(minutes=18),
+    "m20": timedelta(minutes=20),
+    "m21": timedelta(minutes=21),
+    "m30": timedelta(minutes=30),
+    "m35": timedelta(minutes=35),
+    "m39": timedelta(minutes=39),
+    "m40": timedelta(minutes=40),
+    "m44": timedelta(minutes=44),
+    "h1m15": timedelta(hours=1, minutes=15),
+    "h2": timedelta(hours=2),
+    "h8": timedelta(hours=8),
+}
 
 INSTRUMENT_CATALOG: tuple[tuple[str, str, Decimal], ...] = (
     ("RELIANCE", "Reliance Industries Ltd", Decimal("2870.50")),
@@ -117,8 +220,62 @@ class SeedContext:
     selected_instruments: list[Instrument]
 
 
-def _increment(counter: Counter[str], key: str, amount: int = 1) -> None:
-    counter[key] += amount
+def _increment(counter: list[int], key: str, amount: int = 1) -> None:
+    counter[MODEL_COUNT_INDEX[key]] += amount
+
+
+def _seed_names(run_number: int, run_code: str) -> dict[str, str]:
+    context = {"n": run_number, "run_code": run_code}
+    return {key: template.format_map(context) for key, template in SEED_NAME_TEMPLATES.items()}
+
+
+def _insert_rows(model: type[Model], objs: Sequence[Model]) -> None:
+    """Insert ``objs`` using COPY on PostgreSQL and batched ``bulk_create`` elsewhere.
+
+    COPY does not return generated primary keys, so on PostgreSQL ``objs`` keep
+    ``pk=None`` after the call.
+    """
+    if connection.vendor != "postgresql":
+        model.objects.bulk_create(objs, batch_size=settings.SEED_BULK_BATCH_SIZE)
+        return
+
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    _insert_values(
+        model,
+        [field.name for field in fields],
+        [[field.pre_save(obj, add=True) for field in fields] for obj in objs],
+    )
+
+
+def _insert_values(
+    model: type[Model], field_names: Sequence[str], rows: Sequence[Sequence[Any]]
+) -> None:
+    """Insert raw value ``rows`` for ``field_names`` without building model instances.
+
+    Values go through each field's ``get_db_prep_save``; PostgreSQL streams them with
+    COPY and other backends use a single ``executemany`` INSERT.
+    """
+    fields = [model._meta.get_field(field_name) for field_name in field_names]
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    prepared_rows = [
+        [
+            field.get_db_prep_save(value, connection)
+            for field, value in zip(fields, row, strict=True)
+        ]
+        for row in rows
+    ]
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            with cursor.cursor.copy(f"COPY {table} ({columns}) FROM STDIN") as copy:
+                for prepared_row in prepared_rows:
+                    copy.write_row(prepared_row)
+            return
+
+        placeholders = ", ".join(["%s"] * len(fields))
+        cursor.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", prepared_rows
+        )
 
 
 class Command(BaseCommand):
@@ -139,7 +296,15 @@ class Command(BaseCommand):
             "--password",
             type=str,
             default=DEFAULT_PASSWORD,
-            help="Password used for generated seed users.",
+            help=(
+                "Password used for generated seed users. It is hashed once and every "
+                "seed user shares the resulting hash."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Run every seed cycle and report the counts, then roll all writes back.",
         )
 
     def handle(self, *args: object, **options: object) -> None:
@@ -149,160 +314,209 @@ class Command(BaseCommand):
             raise CommandError("Invalid command options for seed_demo_data.")
         cycles = cycles_raw
         password = password_raw
+        dry_run = bool(options.get("dry_run"))
 
         if cycles <= 0:
             raise CommandError("--cycles must be a positive integer.")
 
+        self._user_model = get_user_model()
+        # All seed users share one hash so PBKDF2 runs once per command, not per user.
+        password_hash = make_password(password)
         base_run = self._next_seed_run_number()
-        created = Counter[str]()
+        created = [0] * len(MODEL_COUNTS_ORDER)
         completed_runs: list[int] = []
+        instrument_keys = self._existing_instrument_keys()
 
-        for offset in range(cycles):
-            run_number = base_run + offset
-            with transaction.atomic():
+        # One transaction for the whole run: a failing cycle aborts the command, so
+        # per-cycle savepoints would only add SAVEPOINT/RELEASE round-trips.
+        with transaction.atomic():
+            for offset in range(cycles):
+                run_number = base_run + offset
                 context = self._seed_cycle(
-                    run_number=run_number, password=password, created=created
+                    run_number=run_number,
+                    run_code=f"{run_number:04d}",
+                    password_hash=password_hash,
+                    instrument_keys=instrument_keys,
+                    created=created,
                 )
-            completed_runs.append(context.run_number)
+                completed_runs.append(context.run_number)
+            if dry_run:
+                transaction.set_rollback(True)
 
         run_label = (
             f"run #{completed_runs[0]}"
             if len(completed_runs) == 1
             else f"runs #{completed_runs[0]} to #{completed_runs[-1]}"
         )
-        self.stdout.write(
+        summary_prefix = "Dry run (rolled back): would seed" if dry_run else "Seeded"
+        summary_lines = [
             self.style.SUCCESS(
-                f"Seeded demo data for {run_label}. "
-                f"(cycles={cycles}, generated_users={created['users']})"
+                f"{summary_prefix} demo data for {run_label}. "
+                f"(cycles={cycles}, generated_users={created[MODEL_COUNT_INDEX['users']]})"
             )
+        ]
+        summary_lines.extend(
+            f"- {model_key}: +{count}"
+            for model_key, count in zip(MODEL_COUNTS_ORDER, created, strict=True)
+            if count > 0
         )
-        for model_key in MODEL_COUNTS_ORDER:
-            if created[model_key] > 0:
-                self.stdout.write(f"- {model_key}: +{created[model_key]}")
+        self.stdout.write("\n".join(summary_lines))
 
     def _next_seed_run_number(self) -> int:
-        user_model = get_user_model()
-        max_run_number = 0
-        usernames = user_model.objects.filter(username__startswith="seed_owner_").values_list(
-            "username",
-            flat=True,
-        )
-        for username in usernames:
-            match = SEED_OWNER_RE.match(str(username))
-            if match is None:
-                continue
-            max_run_number = max(max_run_number, int(match.group(1)))
-        return max_run_number + 1
-
-    def _seed_cycle(self, run_number: int, password: str, created: Counter[str]) -> SeedContext:
+        # Runs once per command, so the username scan stays unindexed. The only
+        # index on the user table is the email trigram index (core 0002), which
+        # backs the admin email searches.
+        result = self._user_model.objects.filter(username__regex=SEED_OWNER_PATTERN).aggregate(
+            max_run_number=Max(
+                Cast(Substr("username", len(SEED_OWNER_PREFIX) + 1), IntegerField())
+            )
+        )
+        return int(result["max_run_number"] or 0) + 1
+
+    def _seed_cycle(
+        self,
+        run_number: int,
+        run_code: str,
+        password_hash: str,
+        instrument_keys: set[tuple[str, str, str]],
+        created: list[int],
+    ) -> SeedContext:
         now = timezone.now()
-        owner = self._create_seed_user(
-            username=f"seed_owner_{run_number:04d}",
-            email=f"seed.owner.{run_number:04d}@example.com",
-            password=password,
-            first_name="Seed",
-            last_name=f"Owner {run_number}",
-        )
-        approver = self._create_seed_user(
-            username=f"seed_approver_{run_number:04d}",
-            email=f"seed.approver.{run_number:04d}@example.com",
-            password=password,
-            first_name="Seed",
-            last_name=f"Approver {run_number}",
+        names = _seed_names(run_number, run_code)
+        default_model = settings.OPENROUTER_DEFAULT_MODEL
+        owner, approver = self._user_model.objects.bulk_create(
+            [
+                self._build_seed_user(
+                    username=names["owner_username"],
+                    email=names["owner_email"],
+                    password_hash=password_hash,
+                    first_name="Seed",
+                    last_name=names["owner_last_name"],
+                ),
+                self._build_seed_user(
+                    username=names["approver_username"],
+                    email=names["approver_email"],
+                    password_hash=password_hash,
+                    first_name="Seed",
+                    last_name=names["approver_last_name"],
+                ),
+            ]
         )
         _increment(created, "users", amount=2)
 
-        UserProfile.objects.create(
-            user=owner,
-            telegram_chat_id=str(9_000_000_000 + run_number),
-            timezone="Asia/Kolkata",
-        )
-        UserProfile.objects.create(
-            user=approver,
-            telegram_chat_id=str(9_100_000_000 + run_number),
-            timezone="Asia/Kolkata",
+        UserProfile.objects.bulk_create(
+            [
+                UserProfile(
+                    user=owner,
+                    telegram_chat_id=str(9_000_000_000 + run_number),
+                    timezone="Asia/Kolkata",
+                ),
+                UserProfile(
+                    user=approver,
+                    telegram_chat_id=str(9_100_000_000 + run_number),
+                    timezone="Asia/Kolkata",
+                ),
+            ]
         )
         _increment(created, "profiles", amount=2)
 
-        default_policy = RiskPolicy.objects.create(
-            owner=owner,
-            name=f"Core Intraday Policy {run_number:04d}",
-            max_order_notional=Decimal("150000"),
-            max_position_notional=Decimal("350000"),
-            max_daily_loss=Decimal("12500"),
-            max_orders_per_day=32,
-            allowed_symbols=["RELIANCE", "TCS", "INFY", "HDFCBANK"],
-            require_market_hours=True,
-            allow_shorting=False,
-            is_default=True,
-        )
-        RiskPolicy.objects.create(
-            owner=owner,
-            name=f"Aggressive Policy {run_number:04d}",
-            max_order_notional=Decimal("250000"),
-            max_position_notional=Decimal("750000"),
-            max_daily_loss=Decimal("40000"),
-            max_orders_per_day=64,
-            allowed_symbols=["NIFTY", "BANKNIFTY", "FINNIFTY"],
-            require_market_hours=True,
-            allow_shorting=True,
-            is_default=False,
+        default_policy, _ = RiskPolicy.objects.bulk_create(
+            [
+                RiskPolicy(
+                    owner=owner,
+                    name=names["default_policy_name"],
+                    **CORE_POLICY_LIMITS,
+                    max_orders_per_day=32,
+                    allowed_symbols=["RELIANCE", "TCS", "INFY", "HDFCBANK"],
+                    require_market_hours=True,
+                    allow_shorting=False,
+                    is_default=True,
+                ),
+                RiskPolicy(
+                    owner=owner,
+                    name=names["aggressive_policy_name"],
+                    **AGGRESSIVE_POLICY_LIMITS,
+                    max_orders_per_day=64,
+                    allowed_symbols=["NIFTY", "BANKNIFTY", "FINNIFTY"],
+                    require_market_hours=True,
+                    allow_shorting=True,
+                    is_default=False,
+                ),
+            ]
         )
         _increment(created, "risk_policies", amount=2)
 
         selected_instruments = self._create_instruments_for_cycle(
-            run_number=run_number, created=created
+            run_number=run_number,
+            run_code=run_code,
+            instrument_keys=instrument_keys,
+            created=created,
         )
 
-        primary_agent = Agent.objects.create(
-            owner=owner,
-            risk_policy=default_policy,
-            name=f"Momentum Pulse {run_number:04d}",
-            slug=f"momentum-pulse-{run_number:04d}",
-            instruction=(
-                "Track trend, relative volume, and institutional flow. "
-                "Generate directional trade ideas only when risk limits allow."
-            ),
-            status=AgentStatus.ACTIVE,
-            execution_mode=ExecutionMode.LIVE if run_number % 2 == 0 else ExecutionMode.PAPER,
-            approval_mode=ApprovalMode.RISK_BASED,
-            required_approvals=2 if run_number % 2 == 0 else 1,
-            schedule_cron="*/15 9-15 * * 1-5",
-            config={
-                "watchlist": [instrument.tradingsymbol for instrument in selected_instruments],
-                "max_position_concentration": 0.35,
-                "analysis_style": "macro+technical",
-                "seed_run": run_number,
-            },
-            is_predictive=True,
-            is_auto_enabled=True,
-            last_run_at=now - timedelta(minutes=4),
+        primary_agent, hedge_agent = Agent.objects.bulk_create(
+            [
+                Agent(
+                    owner=owner,
+                    risk_policy=default_policy,
+                    name=names["primary_agent_name"],
+                    slug=names["primary_agent_slug"],
+                    instruction=(
+                        "Track trend, relative volume, and institutional flow. "
+                        "Generate directional trade ideas only when risk limits allow."
+                    ),
+                    status=AgentStatus.ACTIVE,
+                    execution_mode=(
+                        ExecutionMode.LIVE if run_number % 2 == 0 else ExecutionMode.PAPER
+                    ),
+                    approval_mode=ApprovalMode.RISK_BASED,
+                    required_approvals=2 if run_number % 2 == 0 else 1,
+                    schedule_cron="*/15 9-15 * * 1-5",
+                    config={
+                        "watchlist": [
+                            instrument.tradingsymbol for instrument in selected_instruments
+                        ],
+                        "max_position_concentration": 0.35,
+                        "analysis_style": "macro+technical",
+                        "seed_run": run_number,
+                    },
+                    is_predictive=True,
+                    is_auto_enabled=True,
+                    last_run_at=now - _DELTAS["m4"],
+                ),
+                Agent(
+                    owner=owner,
+                    risk_policy=default_policy,
+                    name=names["hedge_agent_name"],
+                    slug=names["hedge_agent_slug"],
+                    instruction=(
+                        "Monitor drawdown and volatility spikes. "
+                        "Escalate to human approvals before any hedging action."
+                    ),
+                    status=AgentStatus.PAUSED,
+                    execution_mode=ExecutionMode.PAPER,
+                    approval_mode=ApprovalMode.ALWAYS,
+                    required_approvals=1,
+                    schedule_cron="*/30 9-15 * * 1-5",
+                    config={
+                        "hedge_instruments": ["NIFTY", "BANKNIFTY"],
+                        "alert_drawdown_pct": 1.5,
+                        "seed_run": run_number,
+                    },
+                    is_predictive=False,
+                    is_auto_enabled=False,
+                    last_run_at=now - _DELTAS["h1m15"],
+                ),
+            ]
         )
-        hedge_agent = Agent.objects.create(
-            owner=owner,
-            risk_policy=default_policy,
-            name=f"Hedge Sentinel {run_number:04d}",
-            slug=f"hedge-sentinel-{run_number:04d}",
-            instruction=(
-                "Monitor drawdown and volatility spikes. "
-                "Escalate to human approvals before any hedging action."
-            ),
-            status=AgentStatus.PAUSED,
-            execution_mode=ExecutionMode.PAPER,
-            approval_mode=ApprovalMode.ALWAYS,
-            required_approvals=1,
-            schedule_cron="*/30 9-15 * * 1-5",
-            config={
-                "hedge_instruments": ["NIFTY", "BANKNIFTY"],
-                "alert_drawdown_pct": 1.5,
-                "seed_run": run_number,
-            },
-            is_predictive=False,
-            is_auto_enabled=False,
-            last_run_at=now - timedelta(hours=1, minutes=15),
+        agent_approvers = Agent.approvers.through
+        agent_approvers.objects.bulk_create(
+            [
+                agent_approvers(agent_id=primary_agent.pk, user_id=approver.pk),
+                agent_approvers(agent_id=primary_agent.pk, user_id=owner.pk),
+                agent_approvers(agent_id=hedge_agent.pk, user_id=approver.pk),
+            ],
+            ignore_conflicts=True,
         )
-        primary_agent.approvers.add(approver, owner)
-        hedge_agent.approvers.add(approver)
         _increment(created, "agents", amount=2)
 
         pending_run = AgentAnalysisRun.objects.create(
@@ -310,7 +524,7 @@ class Command(BaseCommand):
             requested_by=owner,
             status=AnalysisRunStatus.PENDING,
             query=f"Pre-open setup for {selected_instruments[0].tradingsymbol}",
-            model=settings.OPENROUTER_DEFAULT_MODEL,
+            model=default_model,
             max_steps=6,
             usage={"prompt_tokens": 0, "completion_tokens": 0},
             metadata={"source": "seed_demo_data", "seed_run": run_number},
@@ -320,11 +534,11 @@ class Command(BaseCommand):
             requested_by=owner,
             status=AnalysisRunStatus.RUNNING,
             query=f"Intraday momentum check for {selected_instruments[1].tradingsymbol}",
-            model=settings.OPENROUTER_DEFAULT_MODEL,
+            model=default_model,
             max_steps=6,
             steps_executed=3,
             usage={"prompt_tokens": 920, "completion_tokens": 180},
-            started_at=now - timedelta(minutes=7),
+            started_at=now - _DELTAS["m7"],
             metadata={"phase": "research", "seed_run": run_number},
         )
         completed_run = AgentAnalysisRun.objects.create(
@@ -332,7 +546,7 @@ class Command(BaseCommand):
             requested_by=owner,
             status=AnalysisRunStatus.COMPLETED,
             query=f"Synthesize news and order-flow for {selected_instruments[2].tradingsymbol}",
-            model=settings.OPENROUTER_DEFAULT_MODEL,
+            model=default_model,
             max_steps=7,
             steps_executed=7,
             usage={"prompt_tokens": 1820, "completion_tokens": 560},
@@ -340,8 +554,8 @@ class Command(BaseCommand):
                 "Signal quality is positive with confirming breadth; "
                 "recommend scaled entry with protective stop under VWAP."
             ),
-            started_at=now - timedelta(minutes=30),
-            completed_at=now - timedelta(minutes=21),
+            started_at=now - _DELTAS["m30"],
+            completed_at=now - _DELTAS["m21"],
             metadata={"confidence": 0.74, "seed_run": run_number},
         )
         failed_run = AgentAnalysisRun.objects.create(
@@ -349,13 +563,13 @@ class Command(BaseCommand):
             requested_by=owner,
             status=AnalysisRunStatus.FAILED,
             query="Evaluate hedge trigger after volatility expansion",
-            model=settings.OPENROUTER_DEFAULT_MODEL,
+            model=default_model,
             max_steps=5,
             steps_executed=2,
             usage={"prompt_tokens": 640, "completion_tokens": 70},
             error_message="Web research timeout while fetching macro event feed.",
-            started_at=now - timedelta(minutes=18),
-            completed_at=now - timedelta(minutes=16),
+            started_at=now - _DELTAS["m18"],
+            completed_at=now - _DELTAS["m16"],
             metadata={"retryable": True, "seed_run": run_number},
         )
         canceled_run = AgentAnalysisRun.objects.create(
@@ -363,54 +577,57 @@ class Command(BaseCommand):
             requested_by=owner,
             status=AnalysisRunStatus.CANCELED,
             query="Risk-on/risk-off classifier before noon session",
-            model=settings.OPENROUTER_DEFAULT_MODEL,
+            model=default_model,
             max_steps=5,
             steps_executed=1,
             usage={"prompt_tokens": 200, "completion_tokens": 20},
-            started_at=now - timedelta(minutes=11),
-            completed_at=now - timedelta(minutes=10),
+            started_at=now - _DELTAS["m11"],
+            completed_at=now - _DELTAS["m10"],
             metadata={"cancel_reason": "operator_cancel", "seed_run": run_number},
         )
         _increment(created, "analysis_runs", amount=5)
 
-        analysis_events_count = 0
-        analysis_events_count += self._create_analysis_events(
+        analysis_events: list[AgentAnalysisEvent] = []
+        analysis_events += self._build_analysis_events(
             run=running_run,
             events=(
-                ("analysis.started", {"state": "running"}),
+                ANALYSIS_STARTED_EVENT,
                 ("tool.google_search", {"query": running_run.query}),
                 ("analysis.partial", {"confidence": 0.51}),
             ),
         )
-        analysis_events_count += self._create_analysis_events(
+        analysis_events += self._build_analysis_events(
             run=completed_run,
             events=(
-                ("analysis.started", {"state": "running"}),
+                ANALYSIS_STARTED_EVENT,
                 ("analysis.signal", {"direction": "long", "confidence": 0.74}),
                 ("analysis.completed", {"verdict": "buy_on_pullback"}),
             ),
         )
-        analysis_events_count += self._create_analysis_events(
+        analysis_events += self._build_analysis_events(
             run=failed_run,
             events=(
-                ("analysis.started", {"state": "running"}),
+                ANALYSIS_STARTED_EVENT,
                 ("analysis.error", {"reason": "web_fetch_timeout"}),
             ),
         )
-        analysis_events_count += self._create_analysis_events(
+        analysis_events += self._build_analysis_events(
             run=canceled_run,
             events=(
-                ("analysis.started", {"state": "running"}),
+                ANALYSIS_STARTED_EVENT,
                 ("analysis.canceled", {"reason": "manual_stop"}),
             ),
         )
-        _increment(created, "analysis_events", amount=analysis_events_count)
+        AgentAnalysisEvent.objects.bulk_create(
+            analysis_events, batch_size=settings.SEED_BULK_BATCH_SIZE
+        )
+        _increment(created, "analysis_events", amount=len(analysis_events))
 
         endpoint = AgentAnalysisWebhookEndpoint.objects.create(
             owner=owner,
-            name=f"seed-webhook-{run_number:04d}",
-            callback_url=f"https://seed-{run_number:04d}.example.com/analysis/webhook",
-            signing_secret_encrypted=f"seed-signing-secret-{run_number:04d}",
+            name=names["webhook_name"],
+            callback_url=names["webhook_callback_url"],
+            signing_secret_encrypted=names["webhook_signing_secret"],
             is_active=True,
             event_types=[
                 AnalysisNotificationEventType.RUN_COMPLETED,
@@ -429,8 +646,8 @@ class Command(BaseCommand):
             status_code=200,
             attempt_count=1,
             max_attempts=3,
-            last_attempt_at=now - timedelta(minutes=20),
-            delivered_at=now - timedelta(minutes=20),
+            last_attempt_at=now - _DELTAS["m20"],
+            delivered_at=now - _DELTAS["m20"],
             request_payload={"run_id": completed_run.id, "status": completed_run.status},
             response_body='{"ok":true}',
         )
@@ -442,8 +659,8 @@ class Command(BaseCommand):
             status_code=502,
             attempt_count=2,
             max_attempts=4,
-            last_attempt_at=now - timedelta(minutes=14),
-            next_retry_at=now + timedelta(minutes=3),
+            last_attempt_at=now - _DELTAS["m14"],
+            next_retry_at=now + _DELTAS["m3"],
             request_payload={"run_id": failed_run.id, "status": failed_run.status},
             response_body="upstream temporarily unavailable",
             error_message="HTTP 502 from subscriber endpoint",
@@ -456,7 +673,7 @@ class Command(BaseCommand):
             status_code=410,
             attempt_count=3,
             max_attempts=3,
-            last_attempt_at=now - timedelta(minutes=9),
+            last_attempt_at=now - _DELTAS["m9"],
             request_payload={"run_id": canceled_run.id, "status": canceled_run.status},
             response_body="resource gone",
             error_message="Subscriber rejected canceled state callback",
@@ -478,7 +695,7 @@ class Command(BaseCommand):
             },
             risk_snapshot={"risk_score": 42, "max_notional_used_pct": 37.8},
             notes="Awaiting desk sign-off after strong opening trend.",
-            expires_at=now + timedelta(minutes=35),
+            expires_at=now + _DELTAS["m35"],
         )
         approved_request = ApprovalRequest.objects.create(
             agent=primary_agent,
@@ -495,8 +712,8 @@ class Command(BaseCommand):
             },
             risk_snapshot={"risk_score": 28, "max_notional_used_pct": 24.2},
             notes="Telegram desk approved after quick liquidity check.",
-            expires_at=now + timedelta(minutes=20),
-            decided_at=now - timedelta(minutes=16),
+            expires_at=now + _DELTAS["m20"],
+            decided_at=now - _DELTAS["m16"],
             decided_by=approver,
             decision_reason="Depth was healthy and spread stayed below threshold.",
         )
@@ -515,8 +732,8 @@ class Command(BaseCommand):
             },
             risk_snapshot={"risk_score": 81, "max_notional_used_pct": 92.1},
             notes="Rejected due to concentration breach on sector exposure.",
-            expires_at=now - timedelta(minutes=2),
-            decided_at=now - timedelta(minutes=12),
+            expires_at=now - _DELTAS["m2"],
+            decided_at=now - _DELTAS["m12"],
             decided_by=owner,
             decision_reason="Order breached max position notional.",
         )
@@ -528,7 +745,7 @@ class Command(BaseCommand):
             required_approvals=1,
             timeout_policy=TimeoutPolicy.AUTO_PAUSE,
             is_escalated=True,
-            escalated_at=now - timedelta(minutes=44),
+            escalated_at=now - _DELTAS["m44"],
             intent_payload={
                 "symbol": selected_instruments[0].tradingsymbol,
                 "side": Side.BUY,
@@ -536,8 +753,8 @@ class Command(BaseCommand):
             },
             risk_snapshot={"risk_score": 65, "max_notional_used_pct": 61.3},
             notes="Escalated request timed out without desk response.",
-            expires_at=now - timedelta(minutes=40),
-            decided_at=now - timedelta(minutes=39),
+            expires_at=now - _DELTAS["m40"],
+            decided_at=now - _DELTAS["m39"],
             decision_reason="Timeout policy expired after escalation window.",
         )
         _increment(created, "approval_requests", amount=4)
@@ -569,14 +786,14 @@ class Command(BaseCommand):
         _increment(created, "approval_decisions", amount=3)
 
         TelegramCallbackEvent.objects.create(
-            callback_query_id=f"seed-callback-{run_number:04d}-approve",
+            callback_query_id=names["approve_callback_id"],
             approval_request=approved_request,
             telegram_user_id=str(9_100_000_000 + run_number),
             decision=DecisionType.APPROVE,
             raw_payload={"action": "approve", "seed_run": run_number},
         )
         TelegramCallbackEvent.objects.create(
-            callback_query_id=f"seed-callback-{run_number:04d}-reject",
+            callback_query_id=names["reject_callback_id"],
             approval_request=rejected_request,
             telegram_user_id=str(9_100_000_000 + run_number),
             decision=DecisionType.REJECT,
@@ -593,7 +810,7 @@ class Command(BaseCommand):
             quantity=5,
             order_type=OrderType.LIMIT,
             product=ProductType.CNC,
-            price=Decimal("1000.00"),
+            price=PENDING_INTENT_PRICE,
             status=IntentStatus.PENDING_APPROVAL,
             request_payload={"seed_run": run_number, "strategy": "momentum_pullback"},
         )
@@ -606,12 +823,12 @@ class Command(BaseCommand):
             quantity=3,
             order_type=OrderType.MARKET,
             product=ProductType.MIS,
-            price=Decimal("1200.00"),
+            price=PLACED_INTENT_PRICE,
             status=IntentStatus.PLACED,
-            broker_order_id=f"KITE-{run_number:04d}-01",
+            broker_order_id=names["broker_order_id"],
             request_payload={"seed_run": run_number, "strategy": "trend_follow"},
             broker_response={"status": "success", "broker_message": "order placed"},
-            placed_at=now - timedelta(minutes=15),
+            placed_at=now - _DELTAS["m15"],
         )
         TradeIntent.objects.create(
             agent=hedge_agent,
@@ -622,7 +839,7 @@ class Command(BaseCommand):
             quantity=4,
             order_type=OrderType.LIMIT,
             product=ProductType.NRML,
-            price=Decimal("950.00"),
+            price=FAILED_INTENT_PRICE,
             status=IntentStatus.FAILED,
             request_payload={"seed_run": run_number, "strategy": "hedge_breakout"},
             failure_reason="Blocked by risk gate: max position notional exceeded.",
@@ -636,84 +853,92 @@ class Command(BaseCommand):
             quantity=2,
             order_type=OrderType.MARKET,
             product=ProductType.MIS,
-            price=Decimal("1015.00"),
+            price=CANCELED_INTENT_PRICE,
             status=IntentStatus.CANCELED,
             request_payload={"seed_run": run_number, "strategy": "volatility_hedge"},
             failure_reason="Canceled because approval request expired.",
         )
         _increment(created, "trade_intents", amount=4)
 
-        self._create_kite_session(
-            user_id=int(owner.id),
-            kite_user_id=f"KITESEED{run_number:04d}",
-            public_token=f"public-token-{run_number:04d}",
-            access_token_last4=f"{run_number % 10_000:04d}",
-            session_expires_at=now + timedelta(hours=8),
-            is_active=True,
-            metadata={"seed_run": run_number, "profile": "owner"},
-        )
-        self._create_kite_session(
-            user_id=int(approver.id),
-            kite_user_id=f"KITEAPPROVER{run_number:04d}",
-            public_token=f"public-token-approver-{run_number:04d}",
-            access_token_last4=f"{(run_number + 77) % 10_000:04d}",
-            session_expires_at=now - timedelta(hours=2),
-            is_active=False,
-            metadata={"seed_run": run_number, "profile": "approver"},
+        KiteSession.objects.bulk_create(
+            [
+                self._build_kite_session(
+                    user=owner,
+                    kite_user_id=names["owner_kite_user_id"],
+                    public_token=names["owner_public_token"],
+                    access_token_last4=f"{run_number % 10_000:04d}",
+                    session_expires_at=now + _DELTAS["h8"],
+                    is_active=True,
+                    metadata={"seed_run": run_number, "profile": "owner"},
+                ),
+                self._build_kite_session(
+                    user=approver,
+                    kite_user_id=names["approver_kite_user_id"],
+                    public_token=names["approver_public_token"],
+                    access_token_last4=f"{(run_number + 77) % 10_000:04d}",
+                    session_expires_at=now - _DELTAS["h2"],
+                    is_active=False,
+                    metadata={"seed_run": run_number, "profile": "approver"},
+                ),
+            ],
+            batch_size=settings.SEED_BULK_BATCH_SIZE,
         )
         _increment(created, "kite_sessions", amount=2)
 
-        AuditEvent.objects.create(
-            actor=owner,
-            event_type="seed.cycle.started",
-            level=AuditLevel.INFO,
-            entity_type="seed_run",
-            entity_id=str(run_number),
-            request_id=f"seed-{run_number:04d}-01",
-            payload={"seed_run": run_number, "phase": "start"},
-            message="Seed cycle initialized for demo environment.",
-        )
-        AuditEvent.objects.create(
-            actor=owner,
-            event_type="analysis.run.completed",
-            level=AuditLevel.INFO,
-            entity_type="agent_analysis_run",
-            entity_id=str(completed_run.id),
-            request_id=f"seed-{run_number:04d}-02",
-            payload={"seed_run": run_number, "run_id": completed_run.id},
-            message="Completed analysis run delivered strong long-bias signal.",
-        )
-        AuditEvent.objects.create(
-            actor=approver,
-            event_type="approval.request.overdue",
-            level=AuditLevel.WARNING,
-            entity_type="approval_request",
-            entity_id=str(expired_request.id),
-            request_id=f"seed-{run_number:04d}-03",
-            payload={"seed_run": run_number, "request_id": expired_request.id},
-            message="Escalated approval request expired without final decision.",
-        )
-        AuditEvent.objects.create(
-            actor=owner,
-            event_type="execution.intent.failed",
-            level=AuditLevel.ERROR,
-            entity_type="trade_intent",
-            entity_id=str(rejected_request.trade_intent.id),
-            request_id=f"seed-{run_number:04d}-04",
-            payload={"seed_run": run_number, "intent_status": IntentStatus.FAILED},
-            message="Trade intent rejected due to risk concentration limits.",
-        )
-        AuditEvent.objects.create(
-            actor=owner,
-            event_type="seed.cycle.completed",
-            level=AuditLevel.INFO,
-            entity_type="seed_run",
-            entity_id=str(run_number),
-            request_id=f"seed-{run_number:04d}-05",
-            payload={"seed_run": run_number, "phase": "complete"},
-            message="Seed cycle completed successfully.",
-        )
-        _increment(created, "audit_events", amount=5)
+        audit_events = [
+            AuditEvent(
+                actor=owner,
+                event_type="seed.cycle.started",
+                level=AuditLevel.INFO,
+                entity_type="seed_run",
+                entity_id=str(run_number),
+                request_id=names["audit_request_id_1"],
+                payload={"seed_run": run_number, "phase": "start"},
+                message="Seed cycle initialized for demo environment.",
+            ),
+            AuditEvent(
+                actor=owner,
+                event_type="analysis.run.completed",
+                level=AuditLevel.INFO,
+                entity_type="agent_analysis_run",
+                entity_id=str(completed_run.id),
+                request_id=names["audit_request_id_2"],
+                payload={"seed_run": run_number, "run_id": completed_run.id},
+                message="Completed analysis run delivered strong long-bias signal.",
+            ),
+            AuditEvent(
+                actor=approver,
+                event_type="approval.request.overdue",
+                level=AuditLevel.WARNING,
+                entity_type="approval_request",
+                entity_id=str(expired_request.id),
+                request_id=names["audit_request_id_3"],
+                payload={"seed_run": run_number, "request_id": expired_request.id},
+                message="Escalated approval request expired without final decision.",
+            ),
+            AuditEvent(
+                actor=owner,
+                event_type="execution.intent.failed",
+                level=AuditLevel.ERROR,
+                entity_type="trade_intent",
+                entity_id=str(rejected_request.trade_intent.id),
+                request_id=names["audit_request_id_4"],
+                payload={"seed_run": run_number, "intent_status": IntentStatus.FAILED},
+                message="Trade intent rejected due to risk concentration limits.",
+            ),
+            AuditEvent(
+                actor=owner,
+                event_type="seed.cycle.completed",
+                level=AuditLevel.INFO,
+                entity_type="seed_run",
+                entity_id=str(run_number),
+                request_id=names["audit_request_id_5"],
+                payload={"seed_run": run_number, "phase": "complete"},
+                message="Seed cycle completed successfully.",
+            ),
+        ]
+        _insert_rows(AuditEvent, audit_events)
+        _increment(created, "audit_events", amount=len(audit_events))
 
         return SeedContext(
             run_number=run_number,
@@ -735,109 +960,129 @@ class Command(BaseCommand):
             selected_instruments=selected_instruments,
         )
 
-    def _create_seed_user(
+    def _build_seed_user(
         self,
         username: str,
         email: str,
-        password: str,
+        password_hash: str,
         first_name: str,
         last_name: str,
     ) -> Any:
-        user_model = get_user_model()
-        return user_model.objects.create_user(
-            username=username,
-            email=email,
-            password=password,
+        user_model = self._user_model
+        return user_model(
+            username=user_model.normalize_username(username),
+            email=user_model.objects.normalize_email(email),
+            password=password_hash,
             first_name=first_name,
             last_name=last_name,
             is_staff=True,
         )
 
+    def _existing_instrument_keys(self) -> set[tuple[str, str, str]]:
+        return set(
+            Instrument.objects.filter(
+                tradingsymbol__in=[symbol for symbol, _, _ in INSTRUMENT_CATALOG]
+            ).values_list("tradingsymbol", "exchange", "segment")
+        )
+
     def _create_instruments_for_cycle(
-        self, run_number: int, created: Counter[str]
+        self,
+        run_number: int,
+        run_code: str,
+        instrument_keys: set[tuple[str, str, str]],
+        created: list[int],
     ) -> list[Instrument]:
-        created_instruments: list[Instrument] = []
         catalog_size = len(INSTRUMENT_CATALOG)
         start = (run_number - 1) * 3
         token_base = 10_000_000 + (run_number * 100)
 
-        for offset in range(3):
-            symbol, company_name, base_price = INSTRUMENT_CATALOG[(start + offset) % catalog_size]
+        catalog_rows = [INSTRUMENT_CATALOG[(start + offset) % catalog_size] for offset in range(3)]
+        now = timezone.now()
+        instrument_rows: list[tuple[Any, ...]] = []
+        base_prices: list[Decimal] = []
+        for offset, (symbol, company_name, base_price) in enumerate(catalog_rows):
             exchange = "NSE" if offset < 2 else "BSE"
             segment = exchange
             tradingsymbol = symbol
-            exists = Instrument.objects.filter(
-                tradingsymbol=tradingsymbol,
-                exchange=exchange,
-                segment=segment,
-            ).exists()
-            if exists:
-                tradingsymbol = f"{symbol}{run_number:04d}{offset}"
-
-            instrument = Instrument.objects.create(
-                instrument_token=token_base + offset,
-                tradingsymbol=tradingsymbol,
-                exchange=exchange,
-                name=company_name,
-                segment=segment,
-                instrument_type="EQ",
-                lot_size=1,
-                tick_size=Decimal("0.05"),
-                is_active=True,
+            if (tradingsymbol, exchange, segment) in instrument_keys:
+                tradingsymbol = f"{symbol}{run_code}{offset}"
+            instrument_keys.add((tradingsymbol, exchange, segment))
+
+            instrument_rows.append(
+                (
+                    token_base + offset,
+                    tradingsymbol,
+                    exchange,
+                    company_name,
+                    segment,
+                    "EQ",
+                    1,
+                    INSTRUMENT_TICK_SIZE,
+                    True,
+                    now,
+                    now,
+                )
             )
-            created_instruments.append(instrument)
-            _increment(created, "instruments")
+            base_prices.append(base_price)
+
+        _insert_values(Instrument, INSTRUMENT_INSERT_FIELDS, instrument_rows)
+        # Raw inserts do not hand back generated ids, so re-read them by the unique token.
+        instrument_tokens = [row[0] for row in instrument_rows]
+        by_token = Instrument.objects.in_bulk(instrument_tokens, field_name="instrument_token")
+        created_instruments = [by_token[token] for token in instrument_tokens]
+        _increment(created, "instruments", amount=len(created_instruments))
 
+        run_price_shift = Decimal(run_number % 7)
+        tick_rows: list[tuple[Any, ...]] = []
+        for offset, (instrument, base_price) in enumerate(
+            zip(created_instruments, base_prices, strict=True)
+        ):
+            instrument_price = (
+                base_price + run_price_shift + offset * TICK_PRICE_STEP_PER_INSTRUMENT
+            )
             for tick_offset in range(2):
-                price = (
-                    base_price
-                    + Decimal(run_number % 7)
-                    + Decimal(offset) * Decimal("0.35")
-                    + Decimal(tick_offset) * Decimal("0.25")
-                ).quantize(Decimal("0.01"))
-                TickSnapshot.objects.create(
-                    instrument=instrument,
-                    last_price=price,
-                    volume=150_000
-                    + (run_number * 5_000)
-                    + (offset * 10_000)
-                    + (tick_offset * 4_000),
-                    oi=95_000 + (run_number * 400) + (offset * 750),
-                    source="kite_ticker" if tick_offset == 0 else "seed_replay",
+                price = (instrument_price + tick_offset * TICK_PRICE_STEP_PER_TICK).quantize(
+                    TICK_PRICE_QUANTUM
+                )
+                tick_rows.append(
+                    (
+                        instrument.pk,
+                        price,
+                        150_000 + (run_number * 5_000) + (offset * 10_000) + (tick_offset * 4_000),
+                        95_000 + (run_number * 400) + (offset * 750),
+                        "kite_ticker" if tick_offset == 0 else "seed_replay",
+                        now,
+                        now,
+                    )
                 )
-                _increment(created, "tick_snapshots")
+        _insert_values(TickSnapshot, TICK_INSERT_FIELDS, tick_rows)
+        _increment(created, "tick_snapshots", amount=len(tick_rows))
 
         return created_instruments
 
-    def _create_analysis_events(
+    def _build_analysis_events(
         self,
         run: AgentAnalysisRun,
         events: tuple[tuple[str, dict[str, Any]], ...],
-    ) -> int:
-        count = 0
-        for idx, (event_type, payload) in enumerate(events, start=1):
-            AgentAnalysisEvent.objects.create(
-                run=run,
-                sequence=idx,
-                event_type=event_type,
-                payload=payload,
-            )
-            count += 1
-        return count
+    ) -> list[AgentAnalysisEvent]:
+        return [
+            AgentAnalysisEvent(run=run, sequence=idx, event_type=event_type, payload=payload)
+            for idx, (event_type, payload) in enumerate(events, start=1)
+        ]
 
-    def _create_kite_session(
+    def _build_kite_session(
         self,
         *,
-        user_id: int,
+        user: Any,
         kite_user_id: str,
         public_token: str,
         access_token_last4: str,
         session_expires_at: datetime | None,
         is_active: bool,
         metadata: dict[str, Any],
-    ) -> None:
-        KiteSession.objects.create(
-            user_id=user_id,
+    ) -> KiteSession:
+        return KiteSession(
+            user=user,
             kite_user_id=kite_user_id,
             public_token=public_token,
             access_token_last4=access_token_last4,
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import migrations
+
+# Nine admin changelists (profiles, agents, analysis runs, webhooks, approval
+# requests and decisions, audit events, Kite sessions, risk policies) search the
+# user table by email substring, so one index on the user table backs all of
+# them. That production search path is why this index sits on a contrib.auth
+# table; the dev-only seed command's username lookup does not get one.
+# Django emits UPPER(email::text) for case-insensitive lookups on PostgreSQL, and
+# emails are short, so a GiST trigram index on that expression is the cheaper fit.
+INDEX_NAME = "user_email_upper_trgm_idx"
+
+
+def _user_table(apps):
+    return apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table
+
+
+def create_user_email_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    table = schema_editor.quote_name(_user_table(apps))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        cursor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            f"ON {table} USING GIST ((UPPER(email::text)) gist_trgm_ops);"
+        )
+
+
+def drop_user_email_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME};")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("core", "0001_postgres_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_user_email_trigram_index, drop_user_email_trigram_index),
+    ]
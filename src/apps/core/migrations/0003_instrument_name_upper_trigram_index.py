@@ -0,0 +1,47 @@
+from django.db import migrations
+
+# InstrumentAdmin searches name with istartswith, which Django emits as
+# UPPER(name::text) LIKE UPPER('term%') on PostgreSQL. The bare-column trigram
+# index from 0001 never matches that expression, so it is rebuilt on UPPER().
+CREATE_STATEMENT = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS market_data_instrument_name_upper_trgm_idx "
+    "ON market_data_instrument USING GIN ((UPPER(name::text)) gin_trgm_ops);"
+)
+DROP_STATEMENT = "DROP INDEX CONCURRENTLY IF EXISTS market_data_instrument_name_upper_trgm_idx;"
+
+BARE_CREATE_STATEMENT = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS market_data_instrument_name_trgm_idx "
+    "ON market_data_instrument USING GIN (name gin_trgm_ops);"
+)
+BARE_DROP_STATEMENT = "DROP INDEX CONCURRENTLY IF EXISTS market_data_instrument_name_trgm_idx;"
+
+
+def _execute(schema_editor, *statements):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def use_upper_name_trigram_index(apps, schema_editor):
+    # Build the replacement first so name searches are never left unindexed.
+    _execute(schema_editor, CREATE_STATEMENT, BARE_DROP_STATEMENT)
+
+
+def restore_bare_name_trigram_index(apps, schema_editor):
+    _execute(schema_editor, BARE_CREATE_STATEMENT, DROP_STATEMENT)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0002_user_email_trigram_index"),
+        ("market_data", "0003_remove_instrument_market_data_name_425101_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_upper_name_trigram_index, restore_bare_name_trigram_index),
+    ]
@@ -0,0 +1,96 @@
+from django.db import migrations
+
+# Append-heavy tables get a larger GIN pending list (in kB) so bursts of
+# inserts are merged into the index in fewer, larger batches.
+APPEND_HEAVY_PENDING_LIST_KB = 8192
+
+# Mostly-empty or short admin-search columns move to GiST trigram indexes: they
+# are smaller and cheaper to update than GIN and still serve LIKE/ILIKE. Columns
+# searched with icontains or istartswith are indexed on UPPER(col::text), the
+# exact expression Django emits for case-insensitive lookups on PostgreSQL; the
+# bare-column indexes from 0001 are never used for those queries.
+#
+# Each replacement is built under a new name before the 0001 index it supersedes
+# is dropped, so searches are never left unindexed. Builds on the same table take
+# conflicting locks, so the statements run one after another.
+FORWARD_STATEMENTS = (
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+        "execution_tradeintent_broker_order_id_upper_trgm_idx "
+        "ON execution_tradeintent USING GIST ((UPPER(broker_order_id::text)) gist_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS execution_tradeintent_broker_order_id_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS approvals_approvalrequest_notes_upper_trgm_idx "
+        "ON approvals_approvalrequest USING GIST ((UPPER(notes::text)) gist_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS approvals_approvalrequest_notes_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+        "approvals_approvalrequest_decision_reason_upper_trgm_idx "
+        "ON approvals_approvalrequest "
+        "USING GIST ((UPPER(decision_reason::text)) gist_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS approvals_approvalrequest_decision_reason_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS audit_auditevent_message_upper_trgm_idx "
+        "ON audit_auditevent USING GIN ((UPPER(message::text)) gin_trgm_ops) "
+        f"WITH (fastupdate = on, gin_pending_list_limit = {APPEND_HEAVY_PENDING_LIST_KB});"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS audit_auditevent_message_trgm_idx;",
+)
+
+REVERSE_STATEMENTS = (
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS audit_auditevent_message_trgm_idx "
+        "ON audit_auditevent USING GIN (message gin_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS audit_auditevent_message_upper_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+        "approvals_approvalrequest_decision_reason_trgm_idx "
+        "ON approvals_approvalrequest USING GIN (decision_reason gin_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS approvals_approvalrequest_decision_reason_upper_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS approvals_approvalrequest_notes_trgm_idx "
+        "ON approvals_approvalrequest USING GIN (notes gin_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS approvals_approvalrequest_notes_upper_trgm_idx;",
+    (
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS execution_tradeintent_broker_order_id_trgm_idx "
+        "ON execution_tradeintent USING GIN (broker_order_id gin_trgm_ops);"
+    ),
+    "DROP INDEX CONCURRENTLY IF EXISTS execution_tradeintent_broker_order_id_upper_trgm_idx;",
+)
+
+
+def _execute(schema_editor, statements):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    # CONCURRENTLY cannot run inside a transaction block, and a multi-statement
+    # query counts as one, so each statement is sent on its own.
+    with schema_editor.connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def rebuild_trigram_indexes(apps, schema_editor):
+    _execute(schema_editor, FORWARD_STATEMENTS)
+
+
+def restore_trigram_indexes(apps, schema_editor):
+    _execute(schema_editor, REVERSE_STATEMENTS)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0003_instrument_name_upper_trigram_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_trigram_indexes, restore_trigram_indexes),
+    ]
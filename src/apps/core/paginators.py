@@ -0,0 +1,40 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts the planner's row estimate for large unfiltered lists.
+
+    An exact ``COUNT(*)`` over an unfiltered, append-heavy table is a full scan. On
+    PostgreSQL the table's ``pg_class.reltuples`` estimate is used instead once it
+    passes ``estimate_threshold``; filtered lists, small tables and other backends
+    keep the exact count.
+    """
+
+    estimate_threshold = 100_000
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self._estimated_count()
+        if estimate is None or estimate < self.estimate_threshold:
+            return int(super().count)
+        return estimate
+
+    def _estimated_count(self) -> int | None:
+        query = getattr(self.object_list, "query", None)
+        if query is None or query.where:
+            return None
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(query.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        return int(row[0]) if row is not None else None
@@ -1,8 +1,20 @@
-from apps.core.services.admin_dashboard import build_admin_dashboard_snapshot
+from apps.core.services.admin_dashboard import (
+    build_admin_dashboard_layout,
+    build_admin_dashboard_snapshot,
+    compute_admin_dashboard_snapshot,
+    invalidate_admin_dashboard_slow_stats,
+    invalidate_admin_dashboard_snapshot,
+    refresh_admin_dashboard_snapshot,
+)
 from apps.core.services.crypto import SecretCrypto, SecretCryptoError
 
 __all__ = [
+    "build_admin_dashboard_layout",
     "build_admin_dashboard_snapshot",
+    "compute_admin_dashboard_snapshot",
+    "invalidate_admin_dashboard_slow_stats",
+    "invalidate_admin_dashboard_snapshot",
+    "refresh_admin_dashboard_snapshot",
     "SecretCrypto",
     "SecretCryptoError",
 ]
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlencode
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Q
+from django.core.cache import cache
+from django.db.models import (
+    Aggregate,
+    Avg,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    JSONField,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import JSONObject, Substr
 from django.urls import reverse
 from django.utils import timezone
 
@@ -21,7 +38,6 @@ from apps.approvals.models import (
     ApprovalDecision,
     ApprovalRequest,
     ApprovalStatus,
-    DecisionType,
 )
 from apps.audit.models import AuditEvent, AuditLevel
 from apps.broker_kite.models import KiteSession
@@ -29,260 +45,115 @@ from apps.execution.models import IntentStatus, TradeIntent
 from apps.market_data.models import Instrument, TickSnapshot
 from apps.risk.models import RiskPolicy
 
+ADMIN_DASHBOARD_CACHE_KEY = "admin_dashboard_snapshot_v1"
+ADMIN_DASHBOARD_SLOW_CACHE_KEY = "admin_dashboard_slow_stats_v1"
+ADMIN_DASHBOARD_REFRESH_INTERVAL_MS = 20_000
+ADMIN_DASHBOARD_LOCK_KEY = "admin_dashboard_snapshot_lock"
+ADMIN_DASHBOARD_LOCK_SECONDS = 30
+ADMIN_DASHBOARD_LOCK_WAIT_SECONDS = 0.1
+ADMIN_DASHBOARD_LOCK_WAIT_ATTEMPTS = 20
+# Tick counts stop at this many rows; the feed only needs "is it flowing", not an
+# exact total over the busiest table. Capped counts are flagged and shown as "N+".
+MARKET_TICK_COUNT_CAP = 10_000
+# Recent-list subtitles only show this many characters, so the database trims
+# long text columns (stack traces, error payloads) before they are sent.
+RECENT_TEXT_CHARS = 90
 
-def _as_int(value: Any) -> int:
-    if value is None:
-        return 0
-    if isinstance(value, bool):
-        return int(value)
-    return int(value)
+
+ADMIN_OBJECT_ID_PLACEHOLDER = "__object_id__"
+
+
+@lru_cache(maxsize=128)
+def _admin_path(name: str) -> str:
+    return str(reverse(name))
+
+
+@lru_cache(maxsize=32)
+def _admin_change_url_template(name: str) -> str:
+    return str(reverse(name, args=[ADMIN_OBJECT_ID_PLACEHOLDER]))
 
 
 def _admin_url(name: str, query: dict[str, Any] | None = None) -> str:
-    url = str(reverse(name))
+    url = _admin_path(name)
     if not query:
         return url
     return f"{url}?{urlencode(query, doseq=True)}"
 
 
+def _admin_change_url(name: str, object_id: int) -> str:
+    # Resolved once per admin view; each row only substitutes its primary key.
+    return _admin_change_url_template(name).replace(ADMIN_OBJECT_ID_PLACEHOLDER, str(object_id))
+
+
 def _format_timestamp(value: datetime | None) -> str:
     if value is None:
         return "N/A"
     return str(timezone.localtime(value).strftime("%d %b %Y %H:%M"))
 
 
-def _tone_for_ratio(numerator: int, denominator: int, warning: float, critical: float) -> str:
-    if denominator <= 0:
-        return "ok"
-    ratio = numerator / denominator
-    if ratio >= critical:
-        return "critical"
-    if ratio >= warning:
-        return "warn"
-    return "ok"
-
-
-def build_admin_dashboard_snapshot() -> dict[str, Any]:
-    now = timezone.now()
-    past_5m = now - timedelta(minutes=5)
-    past_24h = now - timedelta(hours=24)
-    next_24h = now + timedelta(hours=24)
-
-    agent_stats = Agent.objects.aggregate(
-        total=Count("id"),
-        active=Count("id", filter=Q(status=AgentStatus.ACTIVE)),
-        paused=Count("id", filter=Q(status=AgentStatus.PAUSED)),
-        draft=Count("id", filter=Q(status=AgentStatus.DRAFT)),
-        archived=Count("id", filter=Q(status=AgentStatus.ARCHIVED)),
-        auto_enabled=Count("id", filter=Q(is_auto_enabled=True)),
-        predictive=Count("id", filter=Q(is_predictive=True)),
-    )
-    analysis_stats = AgentAnalysisRun.objects.aggregate(
-        total=Count("id"),
-        pending=Count("id", filter=Q(status=AnalysisRunStatus.PENDING)),
-        running=Count("id", filter=Q(status=AnalysisRunStatus.RUNNING)),
-        completed=Count("id", filter=Q(status=AnalysisRunStatus.COMPLETED)),
-        failed=Count("id", filter=Q(status=AnalysisRunStatus.FAILED)),
-        completed_24h=Count(
-            "id",
-            filter=Q(status=AnalysisRunStatus.COMPLETED, created_at__gte=past_24h),
-        ),
-        failed_24h=Count(
-            "id",
-            filter=Q(status=AnalysisRunStatus.FAILED, created_at__gte=past_24h),
-        ),
-    )
-    analysis_duration_stats = AgentAnalysisRun.objects.filter(
-        status=AnalysisRunStatus.COMPLETED,
-        started_at__isnull=False,
-        completed_at__isnull=False,
-        completed_at__gte=past_24h,
-    ).aggregate(
-        average_duration=Avg(
-            ExpressionWrapper(
-                F("completed_at") - F("started_at"),
-                output_field=DurationField(),
-            )
-        )
+def _stats_subquery(queryset: QuerySet[Any], **aggregates: Aggregate) -> Subquery:
+    """Aggregate ``queryset`` into a single JSON object so it can ride along in one query."""
+    return Subquery(
+        queryset.annotate(_one=Value(1))
+        .values("_one")
+        .annotate(stats=JSONObject(**aggregates))
+        .values("stats"),
+        output_field=JSONField(),
     )
 
-    delivery_stats = AgentAnalysisNotificationDelivery.objects.aggregate(
-        total=Count("id"),
-        successful=Count("id", filter=Q(success=True)),
-        retrying=Count(
-            "id",
-            filter=Q(
-                success=False, next_retry_at__isnull=False, attempt_count__lt=F("max_attempts")
-            ),
-        ),
-        failed=Count(
-            "id",
-            filter=Q(success=False)
-            & (Q(next_retry_at__isnull=True) | Q(attempt_count__gte=F("max_attempts"))),
-        ),
-        failed_24h=Count("id", filter=Q(success=False, created_at__gte=past_24h)),
-    )
 
-    approval_stats = ApprovalRequest.objects.aggregate(
-        total=Count("id"),
-        pending=Count("id", filter=Q(status=ApprovalStatus.PENDING)),
-        approved=Count("id", filter=Q(status=ApprovalStatus.APPROVED)),
-        rejected=Count("id", filter=Q(status=ApprovalStatus.REJECTED)),
-        expired=Count("id", filter=Q(status=ApprovalStatus.EXPIRED)),
-        escalated=Count("id", filter=Q(is_escalated=True, status=ApprovalStatus.PENDING)),
-        overdue=Count(
-            "id",
-            filter=Q(
-                status=ApprovalStatus.PENDING,
-                expires_at__isnull=False,
-                expires_at__lt=now,
-            ),
-        ),
-        due_soon=Count(
-            "id",
-            filter=Q(
-                status=ApprovalStatus.PENDING,
-                expires_at__isnull=False,
-                expires_at__gte=now,
-                expires_at__lte=now + timedelta(minutes=15),
-            ),
-        ),
-        approved_24h=Count(
-            "id",
-            filter=Q(
-                status=ApprovalStatus.APPROVED, decided_at__isnull=False, decided_at__gte=past_24h
-            ),
+def _slow_stats_aggregates() -> dict[str, Subquery]:
+    return {
+        "agent_stats": _stats_subquery(
+            Agent.objects.all(),
+            total=Count("id"),
+            active=Count("id", filter=Q(status=AgentStatus.ACTIVE)),
+            paused=Count("id", filter=Q(status=AgentStatus.PAUSED)),
+            auto_enabled=Count("id", filter=Q(is_auto_enabled=True)),
+            predictive=Count("id", filter=Q(is_predictive=True)),
         ),
-        rejected_24h=Count(
-            "id",
-            filter=Q(
-                status__in=(
-                    ApprovalStatus.REJECTED,
-                    ApprovalStatus.EXPIRED,
-                    ApprovalStatus.CANCELED,
-                ),
-                decided_at__isnull=False,
-                decided_at__gte=past_24h,
-            ),
+        "instrument_stats": _stats_subquery(
+            Instrument.objects.filter(is_active=True),
+            active=Count("id"),
         ),
-    )
-    decision_stats = ApprovalDecision.objects.filter(created_at__gte=past_24h).aggregate(
-        total=Count("id"),
-        approve=Count("id", filter=Q(decision=DecisionType.APPROVE)),
-        reject=Count("id", filter=Q(decision=DecisionType.REJECT)),
-        dashboard=Count("id", filter=Q(channel="dashboard")),
-        admin=Count("id", filter=Q(channel="admin")),
-        telegram=Count("id", filter=Q(channel="telegram")),
-    )
-
-    intent_stats = TradeIntent.objects.aggregate(
-        total=Count("id"),
-        pending_approval=Count("id", filter=Q(status=IntentStatus.PENDING_APPROVAL)),
-        approved=Count("id", filter=Q(status=IntentStatus.APPROVED)),
-        queued=Count("id", filter=Q(status=IntentStatus.QUEUED)),
-        placed=Count("id", filter=Q(status=IntentStatus.PLACED)),
-        failed=Count("id", filter=Q(status=IntentStatus.FAILED)),
-        placed_24h=Count("id", filter=Q(status=IntentStatus.PLACED, created_at__gte=past_24h)),
-        failed_24h=Count("id", filter=Q(status=IntentStatus.FAILED, created_at__gte=past_24h)),
-    )
-
-    instrument_stats = Instrument.objects.aggregate(
-        total=Count("id"),
-        active=Count("id", filter=Q(is_active=True)),
-    )
-    tick_stats = TickSnapshot.objects.aggregate(
-        ticks_5m=Count("id", filter=Q(created_at__gte=past_5m)),
-        ticks_24h=Count("id", filter=Q(created_at__gte=past_24h)),
-    )
-
-    kite_stats = KiteSession.objects.aggregate(
-        total=Count("id"),
-        active=Count("id", filter=Q(is_active=True)),
-        expiring_24h=Count(
-            "id",
-            filter=Q(
-                is_active=True,
-                session_expires_at__isnull=False,
-                session_expires_at__gte=now,
-                session_expires_at__lte=next_24h,
-            ),
+        "risk_stats": _stats_subquery(
+            RiskPolicy.objects.all(),
+            total=Count("id"),
+            defaults=Count("id", filter=Q(is_default=True)),
         ),
-        expired=Count(
-            "id",
-            filter=Q(
-                is_active=True,
-                session_expires_at__isnull=False,
-                session_expires_at__lt=now,
+        "profile_stats": _stats_subquery(
+            UserProfile.objects.all(),
+            total=Count("id"),
+            telegram_connected=Count(
+                "id", filter=Q(telegram_chat_id__isnull=False) & ~Q(telegram_chat_id="")
             ),
         ),
-    )
+    }
 
-    risk_stats = RiskPolicy.objects.aggregate(
-        total=Count("id"),
-        defaults=Count("id", filter=Q(is_default=True)),
-        market_hours_required=Count("id", filter=Q(require_market_hours=True)),
-        shorting_enabled=Count("id", filter=Q(allow_shorting=True)),
-    )
-    profile_stats = UserProfile.objects.aggregate(
-        total=Count("id"),
-        telegram_connected=Count(
-            "id", filter=Q(telegram_chat_id__isnull=False) & ~Q(telegram_chat_id="")
-        ),
-    )
-    user_model = get_user_model()
-    user_stats = user_model.objects.aggregate(
-        total=Count("id"), staff=Count("id", filter=Q(is_staff=True))
-    )
 
-    audit_stats = AuditEvent.objects.filter(created_at__gte=past_24h).aggregate(
-        total=Count("id"),
-        info=Count("id", filter=Q(level=AuditLevel.INFO)),
-        warning=Count("id", filter=Q(level=AuditLevel.WARNING)),
-        error=Count("id", filter=Q(level=AuditLevel.ERROR)),
-    )
+def resolve_card_tone(card: dict[str, Any], metric_values: dict[str, Any]) -> str:
+    """Resolve a card's tone from its thresholds; mirrored by control_tower.js."""
+    if "tone" in card:
+        return str(card["tone"])
+    value = metric_values.get(card["metric_key"], 0)
+    denominator_key = card.get("tone_denominator")
+    if denominator_key:
+        value = value / max(metric_values.get(denominator_key, 0), 1)
+    critical = card.get("tone_critical")
+    if critical is not None and value >= critical:
+        return "critical"
+    warning = card.get("tone_warn")
+    if warning is not None and value >= warning:
+        return "warn"
+    return "ok"
 
-    avg_duration = analysis_duration_stats.get("average_duration")
-    average_runtime_seconds = 0
-    if avg_duration is not None:
-        average_runtime_seconds = int(avg_duration.total_seconds())
 
-    metric_values = {
-        "agents_total": _as_int(agent_stats["total"]),
-        "agents_active": _as_int(agent_stats["active"]),
-        "agents_paused": _as_int(agent_stats["paused"]),
-        "agents_auto_enabled": _as_int(agent_stats["auto_enabled"]),
-        "agents_predictive": _as_int(agent_stats["predictive"]),
-        "analysis_running": _as_int(analysis_stats["running"]),
-        "analysis_failed_24h": _as_int(analysis_stats["failed_24h"]),
-        "analysis_completed_24h": _as_int(analysis_stats["completed_24h"]),
-        "analysis_avg_runtime_seconds": average_runtime_seconds,
-        "approvals_pending": _as_int(approval_stats["pending"]),
-        "approvals_overdue": _as_int(approval_stats["overdue"]),
-        "approvals_due_soon": _as_int(approval_stats["due_soon"]),
-        "approvals_escalated": _as_int(approval_stats["escalated"]),
-        "decisions_telegram_24h": _as_int(decision_stats["telegram"]),
-        "intents_pending_approval": _as_int(intent_stats["pending_approval"]),
-        "intents_queued": _as_int(intent_stats["queued"]),
-        "intents_failed_24h": _as_int(intent_stats["failed_24h"]),
-        "intents_placed_24h": _as_int(intent_stats["placed_24h"]),
-        "deliveries_retrying": _as_int(delivery_stats["retrying"]),
-        "deliveries_failed": _as_int(delivery_stats["failed"]),
-        "kite_active_sessions": _as_int(kite_stats["active"]),
-        "kite_expiring_24h": _as_int(kite_stats["expiring_24h"]),
-        "kite_expired": _as_int(kite_stats["expired"]),
-        "market_active_instruments": _as_int(instrument_stats["active"]),
-        "market_ticks_5m": _as_int(tick_stats["ticks_5m"]),
-        "market_ticks_24h": _as_int(tick_stats["ticks_24h"]),
-        "risk_policies_total": _as_int(risk_stats["total"]),
-        "risk_default_policies": _as_int(risk_stats["defaults"]),
-        "profiles_total": _as_int(profile_stats["total"]),
-        "profiles_telegram_connected": _as_int(profile_stats["telegram_connected"]),
-        "users_total": _as_int(user_stats["total"]),
-        "audit_warning_24h": _as_int(audit_stats["warning"]),
-        "audit_error_24h": _as_int(audit_stats["error"]),
-    }
-
-    headline_cards = [
+# Card and panel layouts only depend on URL routing, so they are built once per
+# process. Metric-driven tones are resolved at render time from each card's
+# tone_warn / tone_critical thresholds (see resolve_card_tone).
+@lru_cache(maxsize=1)
+def _headline_cards() -> tuple[dict[str, Any], ...]:
+    return (
         {
             "title": "Active Agents",
             "metric_key": "agents_active",
@@ -342,184 +213,59 @@ def build_admin_dashboard_snapshot() -> dict[str, Any]:
             ),
             "tone": "critical",
         },
-    ]
+    )
 
-    queue_cards = [
+
+@lru_cache(maxsize=1)
+def _queue_cards() -> tuple[dict[str, Any], ...]:
+    return (
         {
             "title": "Overdue approvals",
             "metric_key": "approvals_overdue",
+            "tone_critical": 1,
             "detail": "Pending requests past expiry.",
             "href": _admin_url(
                 "admin:approvals_approvalrequest_changelist",
                 {"status__exact": ApprovalStatus.PENDING, "expires_at__isnull": "False"},
             ),
-            "tone": "critical" if metric_values["approvals_overdue"] > 0 else "ok",
         },
         {
             "title": "Due in 15 minutes",
             "metric_key": "approvals_due_soon",
+            "tone_warn": 1,
             "detail": "Requests close to timeout threshold.",
             "href": _admin_url(
                 "admin:approvals_approvalrequest_changelist",
                 {"status__exact": ApprovalStatus.PENDING},
             ),
-            "tone": "warn" if metric_values["approvals_due_soon"] > 0 else "ok",
         },
         {
             "title": "Failed intents (24h)",
             "metric_key": "intents_failed_24h",
+            "tone_denominator": "intents_placed_24h",
+            "tone_warn": 0.05,
+            "tone_critical": 0.15,
             "detail": "Execution failures in the last day.",
             "href": _admin_url(
                 "admin:execution_tradeintent_changelist",
                 {"status__exact": IntentStatus.FAILED},
             ),
-            "tone": _tone_for_ratio(
-                metric_values["intents_failed_24h"],
-                max(metric_values["intents_placed_24h"], 1),
-                warning=0.05,
-                critical=0.15,
-            ),
         },
         {
             "title": "Expiring Kite sessions",
             "metric_key": "kite_expiring_24h",
+            "tone_warn": 1,
             "detail": "Active broker sessions ending in 24h.",
             "href": _admin_url(
                 "admin:broker_kite_kitesession_changelist", {"is_active__exact": "1"}
             ),
-            "tone": "warn" if metric_values["kite_expiring_24h"] > 0 else "ok",
         },
-    ]
-
-    alerts: list[dict[str, str]] = []
-    if metric_values["approvals_overdue"] > 0:
-        alerts.append(
-            {
-                "title": "Approval SLA breach",
-                "detail": f"{metric_values['approvals_overdue']} requests are overdue.",
-                "tone": "critical",
-                "href": _admin_url(
-                    "admin:approvals_approvalrequest_changelist",
-                    {"status__exact": ApprovalStatus.PENDING},
-                ),
-            }
-        )
-    if metric_values["deliveries_failed"] > 0:
-        alerts.append(
-            {
-                "title": "Webhook delivery failures",
-                "detail": (
-                    f"{metric_values['deliveries_failed']} deliveries need manual inspection."
-                ),
-                "tone": "critical",
-                "href": _admin_url(
-                    "admin:agents_agentanalysisnotificationdelivery_changelist",
-                    {"success__exact": "0"},
-                ),
-            }
-        )
-    if metric_values["kite_expired"] > 0:
-        alerts.append(
-            {
-                "title": "Expired Kite sessions",
-                "detail": f"{metric_values['kite_expired']} active sessions are already expired.",
-                "tone": "critical",
-                "href": _admin_url(
-                    "admin:broker_kite_kitesession_changelist", {"is_active__exact": "1"}
-                ),
-            }
-        )
-    if metric_values["market_ticks_5m"] == 0:
-        alerts.append(
-            {
-                "title": "Market feed is stale",
-                "detail": "No ticks captured in the last 5 minutes.",
-                "tone": "warn",
-                "href": _admin_url("admin:market_data_ticksnapshot_changelist"),
-            }
-        )
-    if not alerts:
-        alerts.append(
-            {
-                "title": "System within thresholds",
-                "detail": "No critical incidents are currently open.",
-                "tone": "ok",
-                "href": _admin_url("admin:index"),
-            }
-        )
-
-    failed_runs = (
-        AgentAnalysisRun.objects.filter(status=AnalysisRunStatus.FAILED)
-        .select_related("agent")
-        .order_by("-created_at")[:6]
-    )
-    expiring_approvals = (
-        ApprovalRequest.objects.filter(
-            status=ApprovalStatus.PENDING,
-            expires_at__isnull=False,
-        )
-        .select_related("agent", "requested_by")
-        .order_by("expires_at", "-created_at")[:6]
-    )
-    failed_intents = (
-        TradeIntent.objects.filter(status=IntentStatus.FAILED)
-        .select_related("agent")
-        .order_by("-created_at")[:6]
-    )
-    latest_audit = (
-        AuditEvent.objects.filter(level__in=(AuditLevel.WARNING, AuditLevel.ERROR))
-        .select_related("actor")
-        .order_by("-created_at")[:6]
     )
 
-    recent = {
-        "failed_runs": [
-            {
-                "title": f"Run #{item.id} · {item.agent.name}",
-                "subtitle": item.error_message[:90]
-                if item.error_message
-                else "No error message captured.",
-                "timestamp": _format_timestamp(item.created_at),
-                "href": reverse("admin:agents_agentanalysisrun_change", args=[item.id]),
-                "tone": "critical",
-            }
-            for item in failed_runs
-        ],
-        "expiring_approvals": [
-            {
-                "title": f"Approval #{item.id} · {item.agent.name}",
-                "subtitle": f"Channel: {item.channel} · Required: {item.required_approvals}",
-                "timestamp": _format_timestamp(item.expires_at),
-                "href": reverse("admin:approvals_approvalrequest_change", args=[item.id]),
-                "tone": "warn",
-            }
-            for item in expiring_approvals
-        ],
-        "failed_intents": [
-            {
-                "title": f"Intent #{item.id} · {item.symbol} {item.side}",
-                "subtitle": item.failure_reason[:90]
-                if item.failure_reason
-                else "No failure reason captured.",
-                "timestamp": _format_timestamp(item.created_at),
-                "href": reverse("admin:execution_tradeintent_change", args=[item.id]),
-                "tone": "critical",
-            }
-            for item in failed_intents
-        ],
-        "audit_highlights": [
-            {
-                "title": f"{item.event_type} · {item.level}",
-                "subtitle": item.message[:90] if item.message else "No message payload",
-                "timestamp": _format_timestamp(item.created_at),
-                "href": reverse("admin:audit_auditevent_change", args=[item.id]),
-                "tone": "critical" if item.level == AuditLevel.ERROR else "warn",
-            }
-            for item in latest_audit
-        ],
-    }
 
-    module_panels = [
+@lru_cache(maxsize=1)
+def _module_panels() -> tuple[dict[str, Any], ...]:
+    return (
         {
             "title": "Agents",
             "description": "Agent lifecycle, autonomy settings, and runtime posture.",
@@ -608,16 +354,395 @@ def build_admin_dashboard_snapshot() -> dict[str, Any]:
                 {"label": "Errors 24h", "metric_key": "audit_error_24h"},
             ],
         },
+    )
+
+
+@lru_cache(maxsize=1)
+def _alert_templates() -> tuple[tuple[str, dict[str, str]], ...]:
+    # Each alert is gated by a flag derived from the aggregate statement; the
+    # detail text is formatted with the metric values of the snapshot.
+    return (
+        (
+            "overdue_approvals",
+            {
+                "title": "Approval SLA breach",
+                "detail": "{approvals_overdue} requests are overdue.",
+                "tone": "critical",
+                "href": _admin_url(
+                    "admin:approvals_approvalrequest_changelist",
+                    {"status__exact": ApprovalStatus.PENDING},
+                ),
+            },
+        ),
+        (
+            "failed_deliveries",
+            {
+                "title": "Webhook delivery failures",
+                "detail": "{deliveries_failed} deliveries need manual inspection.",
+                "tone": "critical",
+                "href": _admin_url(
+                    "admin:agents_agentanalysisnotificationdelivery_changelist",
+                    {"success__exact": "0"},
+                ),
+            },
+        ),
+        (
+            "expired_kite_sessions",
+            {
+                "title": "Expired Kite sessions",
+                "detail": "{kite_expired} active sessions are already expired.",
+                "tone": "critical",
+                "href": _admin_url(
+                    "admin:broker_kite_kitesession_changelist", {"is_active__exact": "1"}
+                ),
+            },
+        ),
+        (
+            "stale_market_feed",
+            {
+                "title": "Market feed is stale",
+                "detail": "No ticks captured in the last 5 minutes.",
+                "tone": "warn",
+                "href": _admin_url("admin:market_data_ticksnapshot_changelist"),
+            },
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _all_clear_alert() -> dict[str, str]:
+    return {
+        "title": "System within thresholds",
+        "detail": "No critical incidents are currently open.",
+        "tone": "ok",
+        "href": _admin_url("admin:index"),
+    }
+
+
+def build_admin_dashboard_layout() -> dict[str, Any]:
+    """Static scaffolding rendered once per page; polling only fetches the snapshot."""
+    return {
+        "refresh_interval_ms": ADMIN_DASHBOARD_REFRESH_INTERVAL_MS,
+        "headline_cards": list(_headline_cards()),
+        "queue_cards": list(_queue_cards()),
+        "module_panels": list(_module_panels()),
+    }
+
+
+def build_admin_dashboard_snapshot() -> dict[str, Any]:
+    snapshot: dict[str, Any] | None = cache.get(ADMIN_DASHBOARD_CACHE_KEY)
+    if snapshot is not None:
+        return snapshot
+
+    # The beat task normally keeps the snapshot warm. When it is missing, only the
+    # lock holder recomputes; concurrent requests wait briefly for its result.
+    if cache.add(ADMIN_DASHBOARD_LOCK_KEY, 1, timeout=ADMIN_DASHBOARD_LOCK_SECONDS):
+        try:
+            return refresh_admin_dashboard_snapshot()
+        finally:
+            cache.delete(ADMIN_DASHBOARD_LOCK_KEY)
+
+    for _ in range(ADMIN_DASHBOARD_LOCK_WAIT_ATTEMPTS):
+        time.sleep(ADMIN_DASHBOARD_LOCK_WAIT_SECONDS)
+        snapshot = cache.get(ADMIN_DASHBOARD_CACHE_KEY)
+        if snapshot is not None:
+            return snapshot
+    return compute_admin_dashboard_snapshot()
+
+
+def refresh_admin_dashboard_snapshot() -> dict[str, Any]:
+    snapshot = compute_admin_dashboard_snapshot()
+    cache.set(
+        ADMIN_DASHBOARD_CACHE_KEY,
+        snapshot,
+        timeout=settings.ADMIN_DASHBOARD_CACHE_SECONDS,
+    )
+    return snapshot
+
+
+def invalidate_admin_dashboard_snapshot() -> None:
+    cache.delete(ADMIN_DASHBOARD_CACHE_KEY)
+
+
+def invalidate_admin_dashboard_slow_stats() -> None:
+    cache.delete(ADMIN_DASHBOARD_SLOW_CACHE_KEY)
+
+
+def compute_admin_dashboard_snapshot() -> dict[str, Any]:
+    now = timezone.now()
+    past_5m = now - timedelta(minutes=5)
+    past_24h = now - timedelta(hours=24)
+    next_24h = now + timedelta(hours=24)
+
+    # Configuration-like totals change rarely, so they are cached separately for
+    # longer and only folded into the aggregate statement when that cache is cold.
+    slow_stats: dict[str, Any] | None = cache.get(ADMIN_DASHBOARD_SLOW_CACHE_KEY)
+    slow_aggregates = _slow_stats_aggregates() if slow_stats is None else {}
+
+    user_model = get_user_model()
+    stats = (
+        user_model.objects.annotate(_one=Value(1))
+        .values("_one")
+        .annotate(
+            user_stats=JSONObject(total=Count("id")),
+            analysis_stats=_stats_subquery(
+                AgentAnalysisRun.objects.all(),
+                running=Count("id", filter=Q(status=AnalysisRunStatus.RUNNING)),
+                completed_24h=Count(
+                    "id",
+                    filter=Q(status=AnalysisRunStatus.COMPLETED, created_at__gte=past_24h),
+                ),
+                failed_24h=Count(
+                    "id",
+                    filter=Q(status=AnalysisRunStatus.FAILED, created_at__gte=past_24h),
+                ),
+            ),
+            average_duration=Subquery(
+                AgentAnalysisRun.objects.filter(
+                    status=AnalysisRunStatus.COMPLETED,
+                    started_at__isnull=False,
+                    completed_at__isnull=False,
+                    completed_at__gte=past_24h,
+                )
+                .annotate(_one=Value(1))
+                .values("_one")
+                .annotate(
+                    average_duration=Avg(
+                        ExpressionWrapper(
+                            F("completed_at") - F("started_at"),
+                            output_field=DurationField(),
+                        )
+                    )
+                )
+                .values("average_duration"),
+                output_field=DurationField(),
+            ),
+            delivery_stats=_stats_subquery(
+                AgentAnalysisNotificationDelivery.objects.filter(success=False),
+                retrying=Count(
+                    "id",
+                    filter=Q(next_retry_at__isnull=False, attempt_count__lt=F("max_attempts")),
+                ),
+                failed=Count(
+                    "id",
+                    filter=Q(next_retry_at__isnull=True) | Q(attempt_count__gte=F("max_attempts")),
+                ),
+            ),
+            approval_stats=_stats_subquery(
+                ApprovalRequest.objects.filter(status=ApprovalStatus.PENDING),
+                pending=Count("id"),
+                escalated=Count("id", filter=Q(is_escalated=True)),
+                overdue=Count("id", filter=Q(expires_at__isnull=False, expires_at__lt=now)),
+                due_soon=Count(
+                    "id",
+                    filter=Q(
+                        expires_at__isnull=False,
+                        expires_at__gte=now,
+                        expires_at__lte=now + timedelta(minutes=15),
+                    ),
+                ),
+            ),
+            decision_stats=_stats_subquery(
+                ApprovalDecision.objects.filter(created_at__gte=past_24h, channel="telegram"),
+                telegram=Count("id"),
+            ),
+            intent_stats=_stats_subquery(
+                TradeIntent.objects.all(),
+                pending_approval=Count("id", filter=Q(status=IntentStatus.PENDING_APPROVAL)),
+                queued=Count("id", filter=Q(status=IntentStatus.QUEUED)),
+                placed_24h=Count(
+                    "id", filter=Q(status=IntentStatus.PLACED, created_at__gte=past_24h)
+                ),
+                failed_24h=Count(
+                    "id", filter=Q(status=IntentStatus.FAILED, created_at__gte=past_24h)
+                ),
+            ),
+            tick_stats=_stats_subquery(
+                TickSnapshot.objects.filter(
+                    pk__in=TickSnapshot.objects.filter(created_at__gte=past_24h)
+                    .order_by("-created_at")
+                    .values("pk")[: MARKET_TICK_COUNT_CAP + 1]
+                ),
+                ticks_5m=Count("id", filter=Q(created_at__gte=past_5m)),
+                ticks_24h=Count("id"),
+            ),
+            kite_stats=_stats_subquery(
+                KiteSession.objects.filter(is_active=True),
+                active=Count("id"),
+                expiring_24h=Count(
+                    "id",
+                    filter=Q(
+                        session_expires_at__isnull=False,
+                        session_expires_at__gte=now,
+                        session_expires_at__lte=next_24h,
+                    ),
+                ),
+                expired=Count(
+                    "id",
+                    filter=Q(session_expires_at__isnull=False, session_expires_at__lt=now),
+                ),
+            ),
+            audit_stats=_stats_subquery(
+                AuditEvent.objects.filter(created_at__gte=past_24h),
+                warning=Count("id", filter=Q(level=AuditLevel.WARNING)),
+                error=Count("id", filter=Q(level=AuditLevel.ERROR)),
+            ),
+            **slow_aggregates,
+        )
+        .get()
+    )
+    if slow_stats is None:
+        slow_stats = {key: stats[key] for key in slow_aggregates}
+        cache.set(
+            ADMIN_DASHBOARD_SLOW_CACHE_KEY,
+            slow_stats,
+            timeout=settings.ADMIN_DASHBOARD_SLOW_CACHE_SECONDS,
+        )
+    agent_stats = slow_stats["agent_stats"]
+    analysis_stats = stats["analysis_stats"]
+    delivery_stats = stats["delivery_stats"]
+    approval_stats = stats["approval_stats"]
+    decision_stats = stats["decision_stats"]
+    intent_stats = stats["intent_stats"]
+    instrument_stats = slow_stats["instrument_stats"]
+    tick_stats = stats["tick_stats"]
+    kite_stats = stats["kite_stats"]
+    risk_stats = slow_stats["risk_stats"]
+    profile_stats = slow_stats["profile_stats"]
+    user_stats = stats["user_stats"]
+    audit_stats = stats["audit_stats"]
+    avg_duration = stats["average_duration"]
+    average_runtime_seconds = int(avg_duration.total_seconds()) if avg_duration else 0
+
+    metric_values = {
+        "agents_total": agent_stats["total"],
+        "agents_active": agent_stats["active"],
+        "agents_paused": agent_stats["paused"],
+        "agents_auto_enabled": agent_stats["auto_enabled"],
+        "agents_predictive": agent_stats["predictive"],
+        "analysis_running": analysis_stats["running"],
+        "analysis_failed_24h": analysis_stats["failed_24h"],
+        "analysis_completed_24h": analysis_stats["completed_24h"],
+        "analysis_avg_runtime_seconds": average_runtime_seconds,
+        "approvals_pending": approval_stats["pending"],
+        "approvals_overdue": approval_stats["overdue"],
+        "approvals_due_soon": approval_stats["due_soon"],
+        "approvals_escalated": approval_stats["escalated"],
+        "decisions_telegram_24h": decision_stats["telegram"],
+        "intents_pending_approval": intent_stats["pending_approval"],
+        "intents_queued": intent_stats["queued"],
+        "intents_failed_24h": intent_stats["failed_24h"],
+        "intents_placed_24h": intent_stats["placed_24h"],
+        "deliveries_retrying": delivery_stats["retrying"],
+        "deliveries_failed": delivery_stats["failed"],
+        "kite_active_sessions": kite_stats["active"],
+        "kite_expiring_24h": kite_stats["expiring_24h"],
+        "kite_expired": kite_stats["expired"],
+        "market_active_instruments": instrument_stats["active"],
+        "market_ticks_5m": tick_stats["ticks_5m"],
+        "market_ticks_24h": min(tick_stats["ticks_24h"], MARKET_TICK_COUNT_CAP),
+        "market_ticks_24h_capped": tick_stats["ticks_24h"] > MARKET_TICK_COUNT_CAP,
+        "risk_policies_total": risk_stats["total"],
+        "risk_default_policies": risk_stats["defaults"],
+        "profiles_total": profile_stats["total"],
+        "profiles_telegram_connected": profile_stats["telegram_connected"],
+        "users_total": user_stats["total"],
+        "audit_warning_24h": audit_stats["warning"],
+        "audit_error_24h": audit_stats["error"],
+    }
+
+    # Flags come from the filtered counts: EXISTS annotations would end up in the
+    # GROUP BY of the statement, which then returns no row on an empty users table.
+    alert_flags = {
+        "overdue_approvals": approval_stats["overdue"] > 0,
+        "failed_deliveries": delivery_stats["failed"] > 0,
+        "expired_kite_sessions": kite_stats["expired"] > 0,
+        "stale_market_feed": tick_stats["ticks_5m"] == 0,
+    }
+    alerts = [
+        {**alert, "detail": alert["detail"].format(**metric_values)}
+        for flag, alert in _alert_templates()
+        if alert_flags[flag]
     ]
+    if not alerts:
+        alerts.append(dict(_all_clear_alert()))
+
+    failed_runs = (
+        AgentAnalysisRun.objects.filter(status=AnalysisRunStatus.FAILED)
+        .select_related("agent")
+        .only("id", "created_at", "agent__name")
+        .annotate(error_message_short=Substr("error_message", 1, RECENT_TEXT_CHARS))
+        .order_by("-created_at")[:6]
+    )
+    expiring_approvals = (
+        ApprovalRequest.objects.filter(
+            status=ApprovalStatus.PENDING,
+            expires_at__isnull=False,
+        )
+        .select_related("agent")
+        .only("id", "expires_at", "channel", "required_approvals", "agent__name")
+        .order_by("expires_at", "-created_at")[:6]
+    )
+    failed_intents = (
+        TradeIntent.objects.filter(status=IntentStatus.FAILED)
+        .only("id", "symbol", "side", "created_at")
+        .annotate(failure_reason_short=Substr("failure_reason", 1, RECENT_TEXT_CHARS))
+        .order_by("-created_at")[:6]
+    )
+    latest_audit = (
+        AuditEvent.objects.filter(level__in=(AuditLevel.WARNING, AuditLevel.ERROR))
+        .only("id", "event_type", "level", "created_at")
+        .annotate(message_short=Substr("message", 1, RECENT_TEXT_CHARS))
+        .order_by("-created_at")[:6]
+    )
+    recent = {
+        "failed_runs": [
+            {
+                "title": f"Run #{item.id} · {item.agent.name}",
+                "subtitle": item.error_message_short or "No error message captured.",
+                "timestamp": _format_timestamp(item.created_at),
+                "href": _admin_change_url("admin:agents_agentanalysisrun_change", item.id),
+                "tone": "critical",
+            }
+            for item in failed_runs
+        ],
+        "expiring_approvals": [
+            {
+                "title": f"Approval #{item.id} · {item.agent.name}",
+                "subtitle": f"Channel: {item.channel} · Required: {item.required_approvals}",
+                "timestamp": _format_timestamp(item.expires_at),
+                "href": _admin_change_url("admin:approvals_approvalrequest_change", item.id),
+                "tone": "warn",
+            }
+            for item in expiring_approvals
+        ],
+        "failed_intents": [
+            {
+                "title": f"Intent #{item.id} · {item.symbol} {item.side}",
+                "subtitle": item.failure_reason_short or "No failure reason captured.",
+                "timestamp": _format_timestamp(item.created_at),
+                "href": _admin_change_url("admin:execution_tradeintent_change", item.id),
+                "tone": "critical",
+            }
+            for item in failed_intents
+        ],
+        "audit_highlights": [
+            {
+                "title": f"{item.event_type} · {item.level}",
+                "subtitle": item.message_short or "No message payload",
+                "timestamp": _format_timestamp(item.created_at),
+                "href": _admin_change_url("admin:audit_auditevent_change", item.id),
+                "tone": "critical" if item.level == AuditLevel.ERROR else "warn",
+            }
+            for item in latest_audit
+        ],
+    }
 
     return {
         "generated_at": now.isoformat(),
         "generated_at_label": _format_timestamp(now),
-        "refresh_interval_ms": 20_000,
         "metric_values": metric_values,
-        "headline_cards": headline_cards,
-        "queue_cards": queue_cards,
+        "alert_flags": alert_flags,
         "alerts": alerts,
         "recent": recent,
-        "module_panels": module_panels,
     }
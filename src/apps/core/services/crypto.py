@@ -1,41 +1,101 @@
 import base64
 import hashlib
+import os
+from functools import lru_cache
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from django.conf import settings
 
+# Tokens written by the AES-GCM scheme carry this prefix; anything else is a
+# legacy Fernet token and is still readable until it is rewrapped.
+AESGCM_TOKEN_PREFIX = "g1:"
+AESGCM_TOKEN_PREFIX_BYTES = AESGCM_TOKEN_PREFIX.encode("ascii")
+AESGCM_NONCE_BYTES = 12
+
 
 class SecretCryptoError(RuntimeError):
     """Raised when secret encryption/decryption fails."""
 
 
+@lru_cache(maxsize=8)
+def _fernet_for_key(raw_key: str) -> Fernet:
+    # Key derivation is deterministic and Fernet instances are stateless, so one
+    # instance per configured key is shared by every SecretCrypto.
+    digest = hashlib.sha256(raw_key.encode("utf-8")).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+@lru_cache(maxsize=8)
+def _aesgcm_for_key(raw_key: str) -> AESGCM:
+    digest = hashlib.sha256(b"secret-crypto-aesgcm:" + raw_key.encode("utf-8")).digest()
+    return AESGCM(digest)
+
+
+@lru_cache(maxsize=1024)
+def _decrypt_token(raw_key: str, cipher_text: str | bytes) -> str:
+    # A token always decrypts to the same plain text under the same key, so hot
+    # secrets (webhook signing keys, broker tokens) skip the cipher work on
+    # repeat reads. Keying on the raw key keeps entries from a rotated key apart.
+    # Both ciphers accept str or bytes tokens directly, so neither is re-encoded.
+    is_aesgcm = (
+        cipher_text.startswith(AESGCM_TOKEN_PREFIX)
+        if isinstance(cipher_text, str)
+        else cipher_text.startswith(AESGCM_TOKEN_PREFIX_BYTES)
+    )
+    if not is_aesgcm:
+        try:
+            decrypted = _fernet_for_key(raw_key).decrypt(cipher_text)
+        except InvalidToken as exc:  # pragma: no cover
+            raise SecretCryptoError("Unable to decrypt stored secret value.") from exc
+        return decrypted.decode("utf-8")
+
+    try:
+        payload = base64.urlsafe_b64decode(cipher_text[len(AESGCM_TOKEN_PREFIX) :])
+        nonce, sealed = payload[:AESGCM_NONCE_BYTES], payload[AESGCM_NONCE_BYTES:]
+        decrypted = _aesgcm_for_key(raw_key).decrypt(nonce, sealed, None)
+    except (InvalidTag, ValueError) as exc:
+        raise SecretCryptoError("Unable to decrypt stored secret value.") from exc
+
+    return decrypted.decode("utf-8")
+
+
 class SecretCrypto:
     def __init__(self, raw_key: str | None = None) -> None:
         source_key = raw_key or settings.ENCRYPTION_KEY
         if not source_key:
             raise SecretCryptoError("ENCRYPTION_KEY is required for secret encryption.")
 
-        self._fernet = Fernet(self._normalize_key(source_key))
-
-    @staticmethod
-    def _normalize_key(raw_key: str) -> bytes:
-        digest = hashlib.sha256(raw_key.encode("utf-8")).digest()
-        return base64.urlsafe_b64encode(digest)
+        self._raw_key = source_key
+        self._aesgcm = _aesgcm_for_key(source_key)
 
     def encrypt(self, plain_text: str) -> str:
         if plain_text == "":
             return ""
 
-        token = self._fernet.encrypt(plain_text.encode("utf-8"))
-        return token.decode("utf-8")
+        nonce = os.urandom(AESGCM_NONCE_BYTES)
+        sealed = self._aesgcm.encrypt(nonce, plain_text.encode("utf-8"), None)
+        token = AESGCM_TOKEN_PREFIX_BYTES + base64.urlsafe_b64encode(nonce + sealed)
+        return token.decode("ascii")
 
-    def decrypt(self, cipher_text: str) -> str:
-        if cipher_text == "":
+    def decrypt(self, cipher_text: str | bytes) -> str:
+        if not cipher_text:
             return ""
 
-        try:
-            decrypted = self._fernet.decrypt(cipher_text.encode("utf-8"))
-        except InvalidToken as exc:  # pragma: no cover
-            raise SecretCryptoError("Unable to decrypt stored secret value.") from exc
+        return _decrypt_token(self._raw_key, cipher_text)
 
-        return decrypted.decode("utf-8")
+    @classmethod
+    def shared(cls) -> "SecretCrypto":
+        # SecretCrypto holds no per-call state, so callers without an injected
+        # instance reuse one per configured key instead of building their own.
+        return _shared_crypto(settings.ENCRYPTION_KEY)
+
+    @staticmethod
+    def is_legacy_token(cipher_text: str) -> bool:
+        return cipher_text != "" and not cipher_text.startswith(AESGCM_TOKEN_PREFIX)
+
+
+@lru_cache(maxsize=8)
+def _shared_crypto(raw_key: str) -> SecretCrypto:
+    return SecretCrypto(raw_key)
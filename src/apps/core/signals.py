@@ -0,0 +1,52 @@
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+
+from apps.accounts.models import UserProfile
+from apps.agents.models import Agent, AgentAnalysisRun
+from apps.approvals.models import ApprovalRequest
+from apps.core.services.admin_dashboard import (
+    invalidate_admin_dashboard_slow_stats,
+    invalidate_admin_dashboard_snapshot,
+)
+from apps.execution.models import TradeIntent
+from apps.market_data.models import Instrument
+from apps.risk.models import RiskPolicy
+
+DASHBOARD_STATE_MODELS = (ApprovalRequest, TradeIntent, AgentAnalysisRun)
+DASHBOARD_SLOW_STATS_MODELS = (get_user_model(), UserProfile, RiskPolicy, Instrument, Agent)
+
+
+def invalidate_dashboard_on_state_change(sender: type, **kwargs: Any) -> None:
+    invalidate_admin_dashboard_snapshot()
+
+
+for _model in DASHBOARD_STATE_MODELS:
+    post_save.connect(
+        invalidate_dashboard_on_state_change,
+        sender=_model,
+        dispatch_uid=f"admin-dashboard-save-{_model._meta.label_lower}",
+    )
+    post_delete.connect(
+        invalidate_dashboard_on_state_change,
+        sender=_model,
+        dispatch_uid=f"admin-dashboard-delete-{_model._meta.label_lower}",
+    )
+
+
+def invalidate_dashboard_slow_stats(sender: type, **kwargs: Any) -> None:
+    invalidate_admin_dashboard_slow_stats()
+
+
+for _model in DASHBOARD_SLOW_STATS_MODELS:
+    post_save.connect(
+        invalidate_dashboard_slow_stats,
+        sender=_model,
+        dispatch_uid=f"admin-dashboard-slow-save-{_model._meta.label_lower}",
+    )
+    post_delete.connect(
+        invalidate_dashboard_slow_stats,
+        sender=_model,
+        dispatch_uid=f"admin-dashboard-slow-delete-{_model._meta.label_lower}",
+    )
@@ -41,6 +41,9 @@
   const moduleCards = Array.from(root.querySelectorAll("[data-module-card]"));
   const moduleGroups = Array.from(root.querySelectorAll("[data-module-group]"));
   const groupFilterButtons = Array.from(root.querySelectorAll("[data-group-filter]"));
+  // Card layout is rendered once with the page; polling only returns metric state.
+  const queueCardsNode = root.querySelector("#control-tower-queue-cards");
+  const queueCards = queueCardsNode ? JSON.parse(queueCardsNode.textContent || "[]") : [];
 
   const escapeHtml = (value) =>
     String(value ?? "")
@@ -148,14 +151,36 @@
     applyModuleFilters(moduleSearchInput?.value || "");
   }
 
+  // Mirrors the metric_value template filter: capped counts render as "N+".
   const updateMetrics = (metrics) => {
     Object.entries(metrics || {}).forEach(([key, value]) => {
+      const text = metrics[`${key}_capped`]
+        ? `${Number(value).toLocaleString("en-US")}+`
+        : String(value);
       root.querySelectorAll(`[data-metric-key="${key}"]`).forEach((node) => {
-        node.textContent = String(value);
+        node.textContent = text;
       });
     });
   };
 
+  // Mirrors resolve_card_tone in apps/core/services/admin_dashboard.py.
+  const cardTone = (card, metrics) => {
+    if (card.tone) {
+      return card.tone;
+    }
+    let value = Number(metrics?.[card.metric_key] ?? 0);
+    if (card.tone_denominator) {
+      value /= Math.max(Number(metrics?.[card.tone_denominator] ?? 0), 1);
+    }
+    if (card.tone_critical != null && value >= card.tone_critical) {
+      return "critical";
+    }
+    if (card.tone_warn != null && value >= card.tone_warn) {
+      return "warn";
+    }
+    return "ok";
+  };
+
   const renderQueueCards = (cards, metrics) => {
     const container = root.querySelector('[data-render-target="queue_cards"]');
     if (!container || !Array.isArray(cards)) {
@@ -165,7 +190,7 @@
       .map((card) => {
         const value = metrics?.[card.metric_key] ?? 0;
         return `
-          <article class="ops-queue-card tone-${escapeHtml(card.tone || "ok")}">
+          <article class="ops-queue-card tone-${escapeHtml(cardTone(card, metrics))}">
             <h3>${escapeHtml(card.title)}</h3>
             <p class="ops-queue-card__value">${escapeHtml(value)}</p>
             <p>${escapeHtml(card.detail || "")}</p>
@@ -224,7 +249,7 @@
       return;
     }
     updateMetrics(snapshot.metric_values);
-    renderQueueCards(snapshot.queue_cards, snapshot.metric_values);
+    renderQueueCards(queueCards, snapshot.metric_values);
     renderAlerts(snapshot.alerts);
     renderFeed("recent_failed_runs", snapshot.recent?.failed_runs || [], "No failed runs yet.");
     renderFeed(
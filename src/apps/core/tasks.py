@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from apps.core.services.admin_dashboard import refresh_admin_dashboard_snapshot
+
+
+@shared_task
+def refresh_admin_dashboard_snapshot_task() -> dict[str, str]:
+    snapshot = refresh_admin_dashboard_snapshot()
+    return {"generated_at": str(snapshot["generated_at"])}
@@ -1,42 +1,91 @@
-from typing import Any
-from urllib.parse import urlparse
+from typing import Any, NamedTuple
 
 from django import template
 
-from apps.core.services.admin_dashboard import build_admin_dashboard_snapshot
+from apps.core.services.admin_dashboard import (
+    build_admin_dashboard_layout,
+    build_admin_dashboard_snapshot,
+    resolve_card_tone,
+)
 
 register = template.Library()
 
+
+class _GroupDef(NamedTuple):
+    id: str
+    title: str
+    description: str
+    labels: frozenset[str]
+
+
 GROUP_DEFINITIONS = (
-    {
-        "id": "trading",
-        "title": "Trading Core",
-        "description": "Agent lifecycle, risk controls, approvals, execution, and market feeds.",
-        "labels": {"agents", "approvals", "execution", "risk", "market_data", "broker_kite"},
-    },
-    {
-        "id": "operations",
-        "title": "Operations",
-        "description": "Account state, audit telemetry, and platform governance.",
-        "labels": {"accounts", "audit"},
-    },
-    {
-        "id": "platform",
-        "title": "Django Platform",
-        "description": "Built-in admin/auth models and framework internals.",
-        "labels": {"auth", "admin", "contenttypes", "sessions"},
-    },
+    _GroupDef(
+        id="trading",
+        title="Trading Core",
+        description="Agent lifecycle, risk controls, approvals, execution, and market feeds.",
+        labels=frozenset(
+            {"agents", "approvals", "execution", "risk", "market_data", "broker_kite"}
+        ),
+    ),
+    _GroupDef(
+        id="operations",
+        title="Operations",
+        description="Account state, audit telemetry, and platform governance.",
+        labels=frozenset({"accounts", "audit"}),
+    ),
+    _GroupDef(
+        id="platform",
+        title="Django Platform",
+        description="Built-in admin/auth models and framework internals.",
+        labels=frozenset({"auth", "admin", "contenttypes", "sessions"}),
+    ),
 )
 
+# Apps are bucketed by position: one slot per group definition, then "other".
+OTHER_GROUP_INDEX = len(GROUP_DEFINITIONS)
+
+LABEL_TO_GROUP_INDEX = {
+    label: index
+    for index, definition in enumerate(GROUP_DEFINITIONS)
+    for label in definition.labels
+}
 
-@register.simple_tag
-def get_admin_dashboard_snapshot() -> dict[str, object]:
-    return build_admin_dashboard_snapshot()
+
+@register.simple_tag(takes_context=True)
+def get_admin_dashboard_snapshot(context: template.Context) -> dict[str, object]:
+    # Memoized per render so repeated tag usages in one page share a snapshot. The
+    # page gets layout and state together; polling only refreshes the state.
+    render_context = context.render_context
+    if "admin_dashboard_snapshot" not in render_context:
+        render_context["admin_dashboard_snapshot"] = {
+            **build_admin_dashboard_layout(),
+            **build_admin_dashboard_snapshot(),
+        }
+    snapshot: dict[str, object] = render_context["admin_dashboard_snapshot"]
+    return snapshot
 
 
 @register.filter
 def metric_value(metrics: dict[str, Any], key: str) -> Any:
-    return metrics.get(key, 0)
+    value = metrics.get(key, 0)
+    # Counts that stopped at a cap carry a "<key>_capped" flag next to them.
+    if metrics.get(f"{key}_capped"):
+        return f"{value:,}+"
+    return value
+
+
+@register.filter
+def card_tone(card: dict[str, Any], metrics: dict[str, Any]) -> str:
+    return resolve_card_tone(card, metrics)
+
+
+def _url_path(url: str) -> str:
+    # Admin app URLs are path-only; drop any scheme/host, query and fragment with
+    # plain string splits instead of a full urlparse.
+    _, separator, rest = url.partition("://")
+    if separator:
+        url = "/" + rest.partition("/")[2]
+    return url.partition("?")[0].partition("#")[0]
 
 
 def _normalize_app_label(app: dict[str, Any]) -> str:
@@ -47,7 +96,7 @@ def _normalize_app_label(app: dict[str, Any]) -> str:
     app_url = app.get("app_url")
     if not app_url:
         return ""
-    path = urlparse(str(app_url)).path.strip("/")
+    path = _url_path(str(app_url)).strip("/")
     if not path:
         return ""
     parts = path.split("/")
@@ -60,40 +109,30 @@ def _normalize_app_label(app: dict[str, Any]) -> str:
 
 @register.simple_tag
 def get_grouped_admin_apps(app_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    app_buckets: dict[str, list[dict[str, Any]]] = {
-        str(definition["id"]): [] for definition in GROUP_DEFINITIONS
-    }
-    app_buckets["other"] = []
+    app_buckets: list[list[dict[str, Any]]] = [[] for _ in range(OTHER_GROUP_INDEX + 1)]
 
     for app in app_list:
-        app_label = _normalize_app_label(app)
-        target_group_id = "other"
-        for definition in GROUP_DEFINITIONS:
-            if app_label in set(definition["labels"]):
-                target_group_id = str(definition["id"])
-                break
-        app_buckets[target_group_id].append(app)
+        target_index = LABEL_TO_GROUP_INDEX.get(_normalize_app_label(app), OTHER_GROUP_INDEX)
+        app_buckets[target_index].append(app)
 
     grouped_apps: list[dict[str, Any]] = []
-    for definition in GROUP_DEFINITIONS:
-        group_id = str(definition["id"])
-        apps = app_buckets[group_id]
+    for definition, apps in zip(GROUP_DEFINITIONS, app_buckets, strict=False):
         if not apps:
             continue
         sorted_apps = sorted(apps, key=lambda item: str(item.get("name", "")))
         model_count = sum(len(item.get("models", [])) for item in sorted_apps)
         grouped_apps.append(
             {
-                "id": group_id,
-                "title": definition["title"],
-                "description": definition["description"],
+                "id": definition.id,
+                "title": definition.title,
+                "description": definition.description,
                 "apps": sorted_apps,
                 "app_count": len(sorted_apps),
                 "model_count": model_count,
             }
         )
 
-    other_apps = app_buckets["other"]
+    other_apps = app_buckets[OTHER_GROUP_INDEX]
     if other_apps:
         sorted_other_apps = sorted(other_apps, key=lambda item: str(item.get("name", "")))
         other_model_count = sum(len(item.get("models", [])) for item in sorted_other_apps)
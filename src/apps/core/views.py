@@ -1,27 +1,42 @@
+import json
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
-from rest_framework.permissions import AllowAny
-from rest_framework.request import Request
-from rest_framework.response import Response
-from rest_framework.views import APIView
-
-
-class HealthCheckView(APIView):
-    permission_classes = [AllowAny]
-    authentication_classes: tuple[type, ...] = ()
-
-    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        configured: dict[str, bool] = {}
-        for key in settings.REQUIRED_RUNTIME_SECRET_KEYS:
-            configured[key] = str(getattr(settings, key, "")).strip() != ""
-        return Response(
-            {
-                "status": "ok",
-                "runtime_secrets": {
-                    "required": list(settings.REQUIRED_RUNTIME_SECRET_KEYS),
-                    "configured": configured,
-                    "all_configured": all(configured.values()),
-                },
-            }
-        )
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+
+
+@lru_cache(maxsize=1)
+def _runtime_secrets_status() -> dict[str, Any]:
+    # Settings are fixed for the process lifetime, so the probe payload is built once.
+    configured: dict[str, bool] = {}
+    for key in settings.REQUIRED_RUNTIME_SECRET_KEYS:
+        configured[key] = str(getattr(settings, key, "")).strip() != ""
+    return {
+        "required": list(settings.REQUIRED_RUNTIME_SECRET_KEYS),
+        "configured": configured,
+        "all_configured": all(configured.values()),
+    }
+
+
+@lru_cache(maxsize=1)
+def _health_check_body() -> bytes:
+    return json.dumps({"status": "ok", "runtime_secrets": _runtime_secrets_status()}).encode()
+
+
+@receiver(setting_changed)
+def _reset_runtime_secrets_status(**kwargs: Any) -> None:
+    _runtime_secrets_status.cache_clear()
+    _health_check_body.cache_clear()
+
+
+class HealthCheckView(View):
+    # A plain Django view: the body is static, so probes skip DRF authentication,
+    # content negotiation and rendering and get the pre-encoded JSON back.
+    http_method_names = ["get", "head", "options"]
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        return HttpResponse(_health_check_body(), content_type="application/json")
@@ -1,5 +1,7 @@
 import uuid
+from collections.abc import Iterable
 from decimal import Decimal
+from typing import cast
 
 from django.db import models
 
@@ -94,8 +96,14 @@ class TradeIntent(TimeStampedModel):
         ]
 
     def save(self, *args: object, **kwargs: object) -> None:
-        if self.price is not None and self.quantity:
-            self.notional_value = Decimal(self.price) * Decimal(self.quantity)
+        update_fields = kwargs.get("update_fields")
+        # Status-only saves from the executor leave price and quantity untouched,
+        # so the stored notional value is still current.
+        prices_changed = update_fields is None or not {"price", "quantity"}.isdisjoint(
+            cast(Iterable[str], update_fields)
+        )
+        if prices_changed and self.price is not None and self.quantity:
+            self.notional_value = Decimal(str(self.price)) * Decimal(self.quantity)
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
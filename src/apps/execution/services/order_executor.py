@@ -1,8 +1,11 @@
+from typing import Any
+
 from django.utils import timezone
 
 from apps.agents.models import ExecutionMode
 from apps.approvals.services.orchestrator import ApprovalOrchestrator
 from apps.broker_kite.services.kite_adapter import KiteAdapter
+from apps.core.services import invalidate_admin_dashboard_snapshot
 from apps.execution.models import IntentStatus, TradeIntent
 from apps.risk.services.policy_engine import RiskPolicyEngine
 
@@ -25,9 +28,11 @@ class TradeIntentExecutor:
         risk_decision = self.risk_engine.evaluate(intent=intent, policy=intent.agent.risk_policy)
 
         if not risk_decision.approved:
-            intent.status = IntentStatus.REJECTED
-            intent.failure_reason = risk_decision.reason
-            intent.save(update_fields=["status", "failure_reason", "updated_at"])
+            self._transition(
+                intent,
+                status=IntentStatus.REJECTED,
+                failure_reason=risk_decision.reason,
+            )
             return {"status": intent.status, "reason": intent.failure_reason}
 
         if not bypass_approval and self.approval_orchestrator.requires_approval(
@@ -38,9 +43,11 @@ class TradeIntentExecutor:
                 intent=intent,
                 risk_score=risk_decision.risk_score,
             )
-            intent.approval_request = approval_request
-            intent.status = IntentStatus.PENDING_APPROVAL
-            intent.save(update_fields=["approval_request", "status", "updated_at"])
+            self._transition(
+                intent,
+                approval_request=approval_request,
+                status=IntentStatus.PENDING_APPROVAL,
+            )
             return {
                 "status": intent.status,
                 "approval_request_id": str(approval_request.id),
@@ -78,3 +85,14 @@ class TradeIntentExecutor:
         )
 
         return {"status": intent.status, "order_id": intent.broker_order_id}
+
+    @staticmethod
+    def _transition(intent: TradeIntent, **fields: Any) -> None:
+        # Price and quantity are untouched here, so a single UPDATE replaces
+        # TradeIntent.save. That intentionally skips pre_save/post_save; the only
+        # receiver is the admin dashboard invalidation, which is done explicitly.
+        fields["updated_at"] = timezone.now()
+        TradeIntent.objects.filter(pk=intent.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(intent, name, value)
+        invalidate_admin_dashboard_snapshot()
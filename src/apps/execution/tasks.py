@@ -8,6 +8,8 @@ from apps.execution.services.order_executor import TradeIntentExecutor
 
 @shared_task(bind=True, max_retries=3)
 def execute_intent_task(self: Any, intent_id: int, bypass_approval: bool = False) -> dict[str, str]:
-    intent = TradeIntent.objects.select_related("agent", "agent__risk_policy").get(id=intent_id)
+    intent = TradeIntent.objects.select_related(
+        "agent", "agent__risk_policy", "approval_request"
+    ).get(id=intent_id)
     executor = TradeIntentExecutor()
     return executor.process(intent, bypass_approval=bypass_approval)
@@ -1,5 +1,8 @@
+from typing import Any
+
 from django.contrib import admin
 
+from apps.core.paginators import EstimatedCountPaginator
 from apps.market_data.models import Instrument, TickSnapshot
 
 
@@ -21,7 +24,7 @@ class InstrumentAdmin(admin.ModelAdmin):
 
 @admin.register(TickSnapshot)
 class TickSnapshotAdmin(admin.ModelAdmin):
-    list_display = ("instrument", "last_price", "volume", "oi", "source", "created_at")
+    list_display = ("symbol", "last_price", "volume", "oi", "source", "created_at")
     list_filter = ("source",)
     search_fields = (
         "=id",
@@ -31,5 +34,12 @@ class TickSnapshotAdmin(admin.ModelAdmin):
     )
     search_help_text = "Search by tick id, instrument token/symbol, or source."
     list_select_related = ("instrument",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
+
+    @admin.display(description="Symbol", ordering="instrument__tradingsymbol")
+    def symbol(self, obj: TickSnapshot) -> Any:
+        # Reads the joined column directly instead of formatting Instrument.__str__.
+        return obj.instrument.tradingsymbol
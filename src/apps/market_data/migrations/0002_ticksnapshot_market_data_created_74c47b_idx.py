@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 13:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_data', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticksnapshot',
+            index=models.Index(fields=['created_at'], name='market_data_created_74c47b_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 14:06
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_data', '0002_ticksnapshot_market_data_created_74c47b_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='instrument',
+            name='market_data_name_425101_idx',
+        ),
+    ]
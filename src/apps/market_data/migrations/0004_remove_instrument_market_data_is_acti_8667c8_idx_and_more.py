@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 14:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market_data', '0003_remove_instrument_market_data_name_425101_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='instrument',
+            index=models.Index(fields=['is_active', 'exchange', 'tradingsymbol'], name='market_data_is_acti_ebfc93_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='instrument',
+            name='market_data_is_acti_8667c8_idx',
+        ),
+    ]
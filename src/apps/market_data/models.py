@@ -27,8 +27,7 @@ class Instrument(TimeStampedModel):
         ]
         indexes = [
             models.Index(fields=("exchange", "tradingsymbol")),
-            models.Index(fields=("is_active", "exchange")),
-            models.Index(fields=("name",)),
+            models.Index(fields=("is_active", "exchange", "tradingsymbol")),
         ]
 
     def __str__(self) -> str:
@@ -50,6 +49,7 @@ class TickSnapshot(TimeStampedModel):
         indexes = [
             models.Index(fields=("instrument", "created_at")),
             models.Index(fields=("source", "created_at")),
+            models.Index(fields=("created_at",)),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from apps.market_data.models import TickSnapshot
+
+
+@shared_task
+def prune_tick_snapshots_task(batch_size: int = 5000) -> dict[str, int]:
+    # Ticks are only read for recent windows, so rows past the retention period are
+    # deleted in created_at order, one bounded batch per statement, to keep the
+    # table and its indexes from growing without limit.
+    retention_days = settings.TICK_SNAPSHOT_RETENTION_DAYS
+    if retention_days <= 0:
+        return {"deleted": 0}
+
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted = 0
+    while True:
+        batch_ids = list(
+            TickSnapshot.objects.filter(created_at__lt=cutoff)
+            .order_by("created_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not batch_ids:
+            break
+        batch_deleted, _ = TickSnapshot.objects.filter(id__in=batch_ids).delete()
+        deleted += batch_deleted
+        if len(batch_ids) < batch_size:
+            break
+
+    return {"deleted": deleted}
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 14:11
+
+from django.db import migrations, models
+
+
+def keep_latest_default_policy_per_owner(apps, schema_editor):
+    RiskPolicy = apps.get_model("risk", "RiskPolicy")
+    seen_owner_ids = set()
+    demoted_ids = []
+    defaults = RiskPolicy.objects.filter(is_default=True).order_by("owner_id", "-updated_at", "-id")
+    for policy_id, owner_id in defaults.values_list("id", "owner_id"):
+        if owner_id in seen_owner_ids:
+            demoted_ids.append(policy_id)
+        seen_owner_ids.add(owner_id)
+    RiskPolicy.objects.filter(id__in=demoted_ids).update(is_default=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('risk', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='riskpolicy',
+            name='risk_riskpo_is_defa_5ad4f8_idx',
+        ),
+        migrations.RunPython(keep_latest_default_policy_per_owner, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='riskpolicy',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('owner',), name='unique_default_risk_policy_per_owner'),
+        ),
+    ]
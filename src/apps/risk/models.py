@@ -1,5 +1,8 @@
+from typing import Any
+
 from django.conf import settings
 from django.db import models
+from django.utils.functional import cached_property
 
 from apps.core.models import TimeStampedModel
 
@@ -27,12 +30,31 @@ class RiskPolicy(TimeStampedModel):
             models.UniqueConstraint(
                 fields=("owner", "name"),
                 name="unique_risk_policy_name_per_owner",
-            )
+            ),
+            models.UniqueConstraint(
+                fields=("owner",),
+                condition=models.Q(is_default=True),
+                name="unique_default_risk_policy_per_owner",
+            ),
         ]
         indexes = [
             models.Index(fields=("owner", "is_default")),
-            models.Index(fields=("is_default",)),
         ]
 
     def __str__(self) -> str:
         return f"{self.owner_id}:{self.name}"
+
+    @cached_property
+    def allowed_symbols_set(self) -> frozenset[str]:
+        # Symbols are compared against TradeIntent.symbol, so non-string entries can
+        # never match and are left out (they may also be unhashable JSON values).
+        symbols = self.allowed_symbols if isinstance(self.allowed_symbols, list) else []
+        return frozenset(symbol for symbol in symbols if isinstance(symbol, str))
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("allowed_symbols_set", None)
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("allowed_symbols_set", None)
+        super().refresh_from_db(*args, **kwargs)
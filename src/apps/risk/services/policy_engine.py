@@ -5,31 +5,41 @@ from apps.execution.models import TradeIntent
 from apps.risk.models import RiskPolicy
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class RiskDecision:
     approved: bool
     reason: str
     risk_score: int
 
 
+# Every outcome is fixed, so evaluate() hands back shared immutable decisions
+# instead of building one per intent.
+NO_POLICY_DECISION = RiskDecision(approved=True, reason="No policy configured.", risk_score=10)
+NOTIONAL_EXCEEDED_DECISION = RiskDecision(
+    approved=False,
+    reason="Order notional exceeds max_order_notional.",
+    risk_score=95,
+)
+SYMBOL_NOT_ALLOWED_DECISION = RiskDecision(
+    approved=False,
+    reason="Symbol not present in allowed_symbols.",
+    risk_score=90,
+)
+PASSED_DECISION = RiskDecision(approved=True, reason="Risk checks passed.", risk_score=20)
+
+ZERO_NOTIONAL = Decimal("0")
+
+
 class RiskPolicyEngine:
     def evaluate(self, intent: TradeIntent, policy: RiskPolicy | None) -> RiskDecision:
         if policy is None:
-            return RiskDecision(approved=True, reason="No policy configured.", risk_score=10)
+            return NO_POLICY_DECISION
 
-        notional = intent.notional_value or Decimal("0")
+        notional = intent.notional_value or ZERO_NOTIONAL
         if notional > policy.max_order_notional:
-            return RiskDecision(
-                approved=False,
-                reason="Order notional exceeds max_order_notional.",
-                risk_score=95,
-            )
-
-        if policy.allowed_symbols and intent.symbol not in policy.allowed_symbols:
-            return RiskDecision(
-                approved=False,
-                reason="Symbol not present in allowed_symbols.",
-                risk_score=90,
-            )
-
-        return RiskDecision(approved=True, reason="Risk checks passed.", risk_score=20)
+            return NOTIONAL_EXCEEDED_DECISION
+
+        if policy.allowed_symbols and intent.symbol not in policy.allowed_symbols_set:
+            return SYMBOL_NOT_ALLOWED_DECISION
+
+        return PASSED_DECISION
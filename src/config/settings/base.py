@@ -66,6 +66,8 @@ DATABASES = {
     )
 }
 
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -109,7 +111,9 @@ CELERY_RESULT_BACKEND = env(
     "CELERY_RESULT_BACKEND",
     default="redis://localhost:6379/1",
 )
-CELERY_TASK_TRACK_STARTED = True
+# Task outcomes are persisted on the models themselves; nothing reads AsyncResult,
+# so tasks skip the result-backend writes unless they opt in with ignore_result=False.
+CELERY_TASK_IGNORE_RESULT = True
 CELERY_TASK_TIME_LIMIT = env.int("CELERY_TASK_TIME_LIMIT", default=60)
 CELERY_TASK_SOFT_TIME_LIMIT = env.int("CELERY_TASK_SOFT_TIME_LIMIT", default=45)
 CELERY_BEAT_SCHEDULE = {
@@ -117,6 +121,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "apps.approvals.tasks.process_expired_approval_requests_task",
         "schedule": 60.0,
     },
+    "refresh-admin-dashboard-snapshot-every-10-seconds": {
+        "task": "apps.core.tasks.refresh_admin_dashboard_snapshot_task",
+        "schedule": 10.0,
+    },
+    "prune-tick-snapshots-every-hour": {
+        "task": "apps.market_data.tasks.prune_tick_snapshots_task",
+        "schedule": 3600.0,
+    },
 }
 
 OPENROUTER_BASE_URL = env("OPENROUTER_BASE_URL", default="https://openrouter.ai/api/v1")
@@ -143,6 +155,10 @@ ANALYSIS_WEBHOOK_RETRY_MAX_SECONDS = env.int(
     "ANALYSIS_WEBHOOK_RETRY_MAX_SECONDS",
     default=900,
 )
+SEED_BULK_BATCH_SIZE = env.int("SEED_BULK_BATCH_SIZE", default=500)
+ADMIN_DASHBOARD_CACHE_SECONDS = env.int("ADMIN_DASHBOARD_CACHE_SECONDS", default=60)
+ADMIN_DASHBOARD_SLOW_CACHE_SECONDS = env.int("ADMIN_DASHBOARD_SLOW_CACHE_SECONDS", default=300)
+TICK_SNAPSHOT_RETENTION_DAYS = env.int("TICK_SNAPSHOT_RETENTION_DAYS", default=7)
 KITE_API_BASE_URL = env("KITE_API_BASE_URL", default="https://api.kite.trade")
 KITE_API_KEY = env("KITE_API_KEY", default="")
 KITE_ACCESS_TOKEN = env("KITE_ACCESS_TOKEN", default="")
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import Client
 from django.utils import timezone
 
@@ -18,6 +19,13 @@ from apps.agents.models import (
 from apps.approvals.models import ApprovalRequest, ApprovalStatus
 from apps.audit.models import AuditEvent, AuditLevel
 from apps.broker_kite.models import KiteSession
+from apps.core.services import (
+    admin_dashboard,
+    build_admin_dashboard_snapshot,
+    compute_admin_dashboard_snapshot,
+)
+from apps.core.tasks import refresh_admin_dashboard_snapshot_task
+from apps.core.templatetags.admin_dashboard import metric_value
 from apps.execution.models import IntentStatus, Side, TradeIntent
 from apps.market_data.models import Instrument, TickSnapshot
 from apps.risk.models import RiskPolicy
@@ -136,5 +144,134 @@ def test_control_tower_metrics_returns_cross_module_snapshot() -> None:
     assert payload["metric_values"]["intents_failed_24h"] == 1
     assert payload["metric_values"]["market_ticks_5m"] == 1
     assert payload["metric_values"]["audit_error_24h"] == 1
-    assert payload["alerts"]
-    assert payload["module_panels"]
+    assert payload["alert_flags"] == {
+        "overdue_approvals": True,
+        "failed_deliveries": False,
+        "expired_kite_sessions": False,
+        "stale_market_feed": False,
+    }
+    assert [alert["detail"] for alert in payload["alerts"]] == ["1 requests are overdue."]
+    assert "module_panels" not in payload
+
+    index_html = client.get("/admin/").content.decode()
+    assert 'id="control-tower-queue-cards"' in index_html
+    assert '<article class="ops-queue-card tone-critical">' in index_html
+
+
+@pytest.mark.django_db
+def test_control_tower_snapshot_is_cached_until_state_changes() -> None:
+    cache.clear()
+    owner = User.objects.create_user(username="cache-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Cache Agent", slug="cache-agent")
+
+    first = build_admin_dashboard_snapshot()
+    Instrument.objects.create(
+        instrument_token=202, tradingsymbol="TCS", exchange="NSE", segment="NSE"
+    )
+    assert build_admin_dashboard_snapshot() == first
+
+    ApprovalRequest.objects.create(agent=agent, requested_by=owner)
+    refreshed = build_admin_dashboard_snapshot()
+    assert refreshed["metric_values"]["approvals_pending"] == 1
+    assert refreshed["metric_values"]["market_active_instruments"] == 1
+
+
+@pytest.mark.django_db
+def test_control_tower_snapshot_aggregates_in_one_query(django_assert_num_queries) -> None:
+    owner = User.objects.create_user(username="agg-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Agg Agent", slug="agg-agent")
+    now = timezone.now()
+    AgentAnalysisRun.objects.create(
+        agent=agent,
+        requested_by=owner,
+        status=AnalysisRunStatus.COMPLETED,
+        query="Summarize breadth",
+        started_at=now - timedelta(seconds=90),
+        completed_at=now,
+    )
+
+    # One aggregate statement plus the four recent-row listings.
+    with django_assert_num_queries(5):
+        snapshot = compute_admin_dashboard_snapshot()
+
+    assert snapshot["metric_values"]["analysis_completed_24h"] == 1
+    assert snapshot["metric_values"]["analysis_avg_runtime_seconds"] == 90
+    assert snapshot["metric_values"]["users_total"] == 1
+
+
+@pytest.mark.django_db
+def test_control_tower_snapshot_builds_on_empty_database() -> None:
+    cache.clear()
+
+    snapshot = compute_admin_dashboard_snapshot()
+
+    assert snapshot["metric_values"]["users_total"] == 0
+    assert snapshot["alert_flags"]["stale_market_feed"] is True
+    assert snapshot["alert_flags"]["overdue_approvals"] is False
+
+
+@pytest.mark.django_db
+def test_control_tower_refresh_task_warms_snapshot_cache(django_assert_num_queries) -> None:
+    cache.clear()
+    User.objects.create_user(username="warm-owner", password="test-pass")
+
+    result = refresh_admin_dashboard_snapshot_task.apply().get()
+
+    with django_assert_num_queries(0):
+        snapshot = build_admin_dashboard_snapshot()
+    assert snapshot["generated_at"] == result["generated_at"]
+    assert snapshot["metric_values"]["users_total"] == 1
+
+
+@pytest.mark.django_db
+def test_control_tower_recent_lists_trim_and_tone_rows() -> None:
+    owner = User.objects.create_user(username="recent-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Recent Agent", slug="recent-agent")
+    AgentAnalysisRun.objects.create(
+        agent=agent,
+        requested_by=owner,
+        status=AnalysisRunStatus.FAILED,
+        query="Why did the feed stall?",
+        error_message="Upstream timeout",
+    )
+    AuditEvent.objects.create(
+        event_type="feed_stalled", level=AuditLevel.ERROR, message="Ticker disconnected"
+    )
+
+    recent = compute_admin_dashboard_snapshot()["recent"]
+
+    assert recent["failed_runs"][0]["subtitle"] == "Upstream timeout"
+    assert recent["audit_highlights"][0]["tone"] == "critical"
+    assert recent["failed_intents"] == []
+
+
+@pytest.mark.django_db
+def test_control_tower_slow_stats_outlive_snapshot_until_their_models_change() -> None:
+    cache.clear()
+    owner = User.objects.create_user(username="slow-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Slow Agent", slug="slow-agent")
+    compute_admin_dashboard_snapshot()
+
+    Agent.objects.filter(id=agent.id).update(status=AgentStatus.ACTIVE)
+    assert compute_admin_dashboard_snapshot()["metric_values"]["agents_active"] == 0
+
+    agent.refresh_from_db()
+    agent.save()
+    assert compute_admin_dashboard_snapshot()["metric_values"]["agents_active"] == 1
+
+
+@pytest.mark.django_db
+def test_control_tower_flags_capped_tick_counts(monkeypatch) -> None:
+    monkeypatch.setattr(admin_dashboard, "MARKET_TICK_COUNT_CAP", 2)
+    instrument = Instrument.objects.create(
+        instrument_token=303, tradingsymbol="SBIN", exchange="NSE", segment="NSE"
+    )
+    for _ in range(3):
+        TickSnapshot.objects.create(instrument=instrument, last_price=600, source="kite_ticker")
+
+    metrics = compute_admin_dashboard_snapshot()["metric_values"]
+
+    assert metrics["market_ticks_24h"] == 2
+    assert metrics["market_ticks_24h_capped"] is True
+    assert metric_value(metrics, "market_ticks_24h") == "2+"
+    assert metric_value(metrics, "market_ticks_5m") == 3
@@ -1,11 +1,15 @@
+import base64
 import hashlib
 import hmac
 import json
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import Mock, patch
 
 import pytest
+from cryptography.fernet import Fernet
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import override_settings
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -26,6 +30,7 @@ from apps.agents.services.analysis_notifications import (
     AnalysisWebhookEndpointService,
 )
 from apps.agents.tasks import dispatch_analysis_run_notifications_task
+from apps.core.services.crypto import AESGCM_TOKEN_PREFIX
 
 User = get_user_model()
 
@@ -313,3 +318,27 @@ def test_dispatch_task_schedules_follow_up_retry() -> None:
     assert mocked_dispatch.call_count == 1
     assert payload["retry_scheduled_in_seconds"] == 45
     mocked_apply_async.assert_called_once_with(args=[run.id], countdown=45)
+
+
+@pytest.mark.django_db
+@override_settings(ENCRYPTION_KEY="unit-test-encryption-key")
+def test_rewrap_encrypted_secrets_moves_legacy_fernet_tokens_to_aesgcm() -> None:
+    owner = User.objects.create_user(username="rewrap-owner", password="test-pass")
+    legacy_key = base64.urlsafe_b64encode(
+        hashlib.sha256(b"unit-test-encryption-key").digest()
+    )
+    legacy_token = Fernet(legacy_key).encrypt(b"legacy-secret").decode("utf-8")
+    endpoint = AgentAnalysisWebhookEndpoint.objects.create(
+        owner=owner,
+        name="legacy-listener",
+        callback_url="https://example.com/hooks/legacy",
+        signing_secret_encrypted=legacy_token,
+    )
+    service = AnalysisWebhookEndpointService()
+    assert service.decrypt_signing_secret(endpoint) == "legacy-secret"
+
+    call_command("rewrap_encrypted_secrets", stdout=StringIO())
+
+    endpoint.refresh_from_db()
+    assert endpoint.signing_secret_encrypted.startswith(AESGCM_TOKEN_PREFIX)
+    assert service.decrypt_signing_secret(endpoint) == "legacy-secret"
@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+import pytest
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from apps.market_data.models import Instrument, TickSnapshot
+from apps.market_data.tasks import prune_tick_snapshots_task
+
+
+@pytest.mark.django_db
+@override_settings(TICK_SNAPSHOT_RETENTION_DAYS=7)
+def test_prune_tick_snapshots_deletes_only_expired_rows() -> None:
+    instrument = Instrument.objects.create(
+        instrument_token=303,
+        tradingsymbol="SBIN",
+        exchange="NSE",
+        segment="NSE",
+    )
+    expired = [
+        TickSnapshot.objects.create(instrument=instrument, last_price=600, source="kite_ticker")
+        for _ in range(3)
+    ]
+    fresh = TickSnapshot.objects.create(instrument=instrument, last_price=601, source="kite_ticker")
+    TickSnapshot.objects.filter(id__in=[tick.id for tick in expired]).update(
+        created_at=timezone.now() - timedelta(days=8)
+    )
+
+    result = prune_tick_snapshots_task.apply(kwargs={"batch_size": 2}).get()
+
+    assert result == {"deleted": 3}
+    assert list(TickSnapshot.objects.values_list("id", flat=True)) == [fresh.id]
@@ -28,6 +28,7 @@ def test_seed_demo_data_creates_records_across_all_models() -> None:
     assert UserProfile.objects.count() >= 2
     assert RiskPolicy.objects.count() >= 2
     assert Agent.objects.count() >= 2
+    assert Agent.approvers.through.objects.count() >= 3
     assert AgentAnalysisRun.objects.count() >= 5
     assert AgentAnalysisEvent.objects.count() >= 10
     assert AgentAnalysisWebhookEndpoint.objects.count() >= 1
@@ -73,3 +74,48 @@ def test_seed_demo_data_is_incremental_for_repeated_runs() -> None:
     assert counts_after_second["approval_requests"] > counts_after_first["approval_requests"]
     assert counts_after_second["trade_intents"] > counts_after_first["trade_intents"]
     assert counts_after_second["audit_events"] > counts_after_first["audit_events"]
+
+
+@pytest.mark.django_db
+def test_seed_demo_data_continues_after_highest_seed_owner_run_number() -> None:
+    User.objects.create_user(username="seed_owner_0041", password="unused-pass-123")
+    User.objects.create_user(username="seed_owner_manual", password="unused-pass-123")
+
+    call_command("seed_demo_data", cycles=1, verbosity=0)
+
+    assert User.objects.filter(username="seed_owner_0042").exists()
+
+
+@pytest.mark.django_db
+def test_seed_demo_data_users_can_log_in_with_seed_password() -> None:
+    call_command("seed_demo_data", cycles=1, password="Demo!Pass987", verbosity=0)
+
+    owner = User.objects.get(username="seed_owner_0001")
+    approver = User.objects.get(username="seed_approver_0001")
+    assert owner.check_password("Demo!Pass987")
+    assert approver.check_password("Demo!Pass987")
+    assert UserProfile.objects.filter(user__in=[owner, approver]).count() == 2
+    assert owner.password == approver.password
+
+
+@pytest.mark.django_db
+def test_seed_demo_data_dry_run_rolls_back_all_writes() -> None:
+    call_command("seed_demo_data", cycles=2, dry_run=True, verbosity=0)
+
+    assert not User.objects.filter(username__startswith="seed_owner_").exists()
+    assert Agent.objects.count() == 0
+    assert Instrument.objects.count() == 0
+    assert TickSnapshot.objects.count() == 0
+    assert AuditEvent.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_seed_demo_data_suffixes_instruments_that_already_exist() -> None:
+    Instrument.objects.create(
+        instrument_token=1, tradingsymbol="RELIANCE", exchange="NSE", segment="NSE"
+    )
+
+    call_command("seed_demo_data", cycles=1, verbosity=0)
+
+    assert Instrument.objects.filter(tradingsymbol="RELIANCE00010", exchange="NSE").exists()
+    assert Instrument.objects.filter(tradingsymbol="TCS", exchange="NSE").exists()
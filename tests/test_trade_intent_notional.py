@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from apps.agents.models import Agent
+from apps.execution.models import IntentStatus, Side, TradeIntent
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_trade_intent_notional_value_accepts_string_price() -> None:
+    owner = User.objects.create_user(username="notional-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Notional Agent", slug="notional-agent")
+
+    intent = TradeIntent.objects.create(
+        agent=agent,
+        symbol="INFY",
+        side=Side.BUY,
+        quantity=2,
+        price="100.50",
+    )
+
+    assert intent.notional_value == Decimal("201.00")
+    intent.refresh_from_db()
+    assert intent.notional_value == Decimal("201.00")
+
+
+@pytest.mark.django_db
+def test_trade_intent_status_save_keeps_notional_value() -> None:
+    owner = User.objects.create_user(username="status-owner", password="test-pass")
+    agent = Agent.objects.create(owner=owner, name="Status Agent", slug="status-agent")
+    intent = TradeIntent.objects.create(
+        agent=agent,
+        symbol="TCS",
+        side=Side.SELL,
+        quantity=3,
+        price=1.1,
+    )
+    assert intent.notional_value == Decimal("3.3")
+
+    intent.status = IntentStatus.QUEUED
+    intent.save(update_fields=["status", "updated_at"])
+
+    intent.refresh_from_db()
+    assert intent.notional_value == Decimal("3.30")